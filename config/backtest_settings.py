@@ -6,6 +6,15 @@ BACKTEST_SETTINGS = {
     # Trade Settings
     'position_size_usd': 100,  # Default position size for backtesting
     
+    # Parameter search: 'exhaustive' tests every combination,
+    # 'coarse_to_fine' tests a thinned grid then refines around the best results,
+    # 'bayesian' samples combinations with Optuna's TPE sampler (requires optuna)
+    'search_mode': 'exhaustive',
+    'bayesian_trials': 100,  # Backtests per coin in 'bayesian' mode
+    
+    # Also save every tested combination to results/*_all.parquet (requires pyarrow)
+    'fast_io': True,
+    
     # Optimization Ranges for RSI 1min
     'rsi_1min_optimization': {
         'period': [10, 12, 14, 16, 18, 20],  # RSI periods to test
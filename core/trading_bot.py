@@ -6,7 +6,7 @@ Coordinates signal generators, order manager, and position manager.
 import time
 import threading
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from signals import (
     RSI5MinSignalGenerator, 
     RSI1MinSignalGenerator, 
@@ -267,26 +267,43 @@ class TradingBot:
         logger.info(f"Checking signals at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"Active generators: {', '.join([g.name for g in generators_to_run])}")
         
+        # Generators with a batch API fetch candles for all coins concurrently; a failed
+        # batch is left out so its coins fall back to generate_signal
+        batch_signals = {}
+        for generator in generators_to_run:
+            if hasattr(generator, 'generate_signals_batch'):
+                try:
+                    batch_signals[generator.name] = dict(zip(
+                        self.monitored_coins, generator.generate_signals_batch(self.monitored_coins)))
+                except Exception as e:
+                    logger.error(f"Error generating batch signals from {generator.name}: {e}")
+        
         for coin in self.monitored_coins:
             try:
-                self._check_coin_signals(coin, generators_to_run)
+                self._check_coin_signals(coin, generators_to_run, batch_signals)
             except Exception as e:
                 logger.error(f"Error checking signals for {coin}: {e}")
     
-    def _check_coin_signals(self, coin: str, generators_to_run: List):
+    def _check_coin_signals(self, coin: str, generators_to_run: List,
+                            batch_signals: Optional[Dict[str, Dict]] = None):
         """
         Check signals for a specific coin from specified generators.
         
         Args:
             coin: Coin symbol
             generators_to_run: List of generators to check this cycle
+            batch_signals: Precomputed {generator name: {coin: signal}} from batch generators
         """
         signals = []
+        batch_signals = batch_signals or {}
         
         # Generate signals from specified generators only
         for generator in generators_to_run:
             try:
-                signal = generator.generate_signal(coin)
+                if generator.name in batch_signals:
+                    signal = batch_signals[generator.name].get(coin)
+                else:
+                    signal = generator.generate_signal(coin)
                 if signal and signal.action != "HOLD":
                     signals.append(signal)
             except Exception as e:
@@ -0,0 +1,25 @@
+"""
+Optional Numba JIT support for backtest kernels
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit when Numba is not installed
+        
+        Supports both the bare ``@njit`` and the ``@njit(cache=True)`` forms,
+        returning the undecorated Python function.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
@@ -1,16 +1,132 @@
 """
 Data fetching utilities for backtesting
 """
-import requests
+import os
+import time
+import hashlib
 import pandas as pd
 from datetime import datetime
 from typing import Optional
+from utils.binance_http import SESSION, KLINES_URL, parse_klines
+
+try:
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Candle interval lengths in minutes
+INTERVAL_MINUTES = {
+    '1m': 1,
+    '5m': 5,
+    '15m': 15,
+    '1h': 60,
+    '4h': 240,
+    '1d': 1440
+}
+
+# On-disk candle cache (Feather files, requires pyarrow) under the project directory
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "binance")
+CACHE_MAX_AGE = 24 * 60 * 60  # Prune cache files older than a day (seconds)
+
+# In-process copy of the cache: path -> (expiry time, DataFrame); callers get copies
+_MEMORY_CACHE = {}
+
+# Old cache files are pruned on the first write of each run
+_cache_pruned = False
+
+
+def _cache_path(coin: str, interval: str, start_bucket: int, end_bucket: int) -> str:
+    """
+    Build the cache file path for a candle request
+    
+    Args:
+        coin: Coin symbol
+        interval: Candle interval
+        start_bucket: Start time rounded down to the interval boundary
+        end_bucket: End time rounded down to the interval boundary
+        
+    Returns:
+        Path of the cache file
+    """
+    key = f"{coin}_{interval}_{start_bucket}_{end_bucket}"
+    return os.path.join(CACHE_DIR, hashlib.md5(key.encode()).hexdigest() + ".feather")
+
+
+def _load_cached(path: str, ttl: float) -> Optional[pd.DataFrame]:
+    """
+    Load a cached DataFrame if it exists and is younger than ttl seconds
+    
+    Args:
+        path: Cache file path
+        ttl: Time-to-live in seconds
+        
+    Returns:
+        Cached DataFrame or None on miss
+    """
+    now = time.time()
+    entry = _MEMORY_CACHE.get(path)
+    if entry is not None and now < entry[0]:
+        return entry[1].copy()
+    
+    if not PYARROW_AVAILABLE:
+        return None
+    
+    try:
+        mtime = os.path.getmtime(path)
+        if now - mtime < ttl:
+            df = feather.read_feather(path)
+            _MEMORY_CACHE[path] = (mtime + ttl, df)
+            return df.copy()
+    except Exception:
+        pass
+    return None
+
+
+def _store_cached(path: str, df: pd.DataFrame, ttl: float) -> None:
+    """
+    Write a DataFrame to the cache and prune expired entries
+    
+    The disk copy is skipped when pyarrow is missing. Files older than
+    CACHE_MAX_AGE are pruned once per run.
+    
+    Args:
+        path: Cache file path
+        df: DataFrame to cache
+        ttl: Time-to-live in seconds
+    """
+    global _cache_pruned
+    now = time.time()
+    for old_path, (expiry, _) in list(_MEMORY_CACHE.items()):
+        if expiry <= now:
+            _MEMORY_CACHE.pop(old_path, None)
+    _MEMORY_CACHE[path] = (now + ttl, df.copy())
+    
+    if not PYARROW_AVAILABLE:
+        return
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        feather.write_feather(df, path)
+        
+        if not _cache_pruned:
+            _cache_pruned = True
+            for name in os.listdir(CACHE_DIR):
+                old_path = os.path.join(CACHE_DIR, name)
+                if now - os.path.getmtime(old_path) > CACHE_MAX_AGE:
+                    os.remove(old_path)
+    except Exception as e:
+        print(f"Error writing candle cache: {e}")
 
 
 def fetch_historical_data(coin: str, minutes: int, interval: str = '1m') -> Optional[pd.DataFrame]:
     """
     Fetch historical candles from Binance
     
+    Results are cached in memory (and on disk with pyarrow) for one candle,
+    so repeated backtests over the same range reuse the downloaded data.
+    
     Args:
         coin: Coin symbol (e.g., 'BTC')
         minutes: Number of minutes of historical data
@@ -21,25 +137,23 @@ def fetch_historical_data(coin: str, minutes: int, interval: str = '1m') -> Opti
     """
     try:
         symbol = f"{coin}USDT"
-        url = "https://api.binance.com/api/v3/klines"
         
         # Calculate how many candles we need based on interval and time range
-        interval_minutes = {
-            '1m': 1,
-            '5m': 5,
-            '15m': 15,
-            '1h': 60,
-            '4h': 240,
-            '1d': 1440
-        }
-        
-        candles_needed = minutes // interval_minutes.get(interval, 1)
+        interval_min = INTERVAL_MINUTES.get(interval, 1)
+        candles_needed = minutes // interval_min
         limit = min(candles_needed, 1000)  # Binance max is 1000
         
         # Calculate start time based on time range
         end_time = int(datetime.now().timestamp() * 1000)
         start_time = end_time - (minutes * 60 * 1000)
         
+        # Cache key is stable within one candle
+        interval_ms = interval_min * 60 * 1000
+        cache_path = _cache_path(coin, interval, start_time // interval_ms, end_time // interval_ms)
+        cached = _load_cached(cache_path, interval_min * 60)
+        if cached is not None:
+            return cached
+        
         params = {
             'symbol': symbol,
             'interval': interval,
@@ -48,23 +162,16 @@ def fetch_historical_data(coin: str, minutes: int, interval: str = '1m') -> Opti
             'limit': limit
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = SESSION.get(KLINES_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         
-        df = pd.DataFrame(data, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-            'taker_buy_quote', 'ignore'
-        ])
-        
-        df['close'] = pd.to_numeric(df['close'])
-        df['high'] = pd.to_numeric(df['high'])
-        df['low'] = pd.to_numeric(df['low'])
-        df['volume'] = pd.to_numeric(df['volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        candles = parse_klines(data)
+        candles['timestamp'] = pd.to_datetime(candles['timestamp'], unit='ms')
+        df = pd.DataFrame(candles)
         
-        return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        _store_cached(cache_path, df, interval_min * 60)
+        return df
         
     except Exception as e:
         print(f"Error fetching data for {coin}: {e}")
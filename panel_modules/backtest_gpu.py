@@ -0,0 +1,107 @@
+"""
+Optional CUDA offload for large backtest parameter grids (requires CuPy)
+"""
+import numpy as np
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+
+# Grids smaller than this stay on the CPU; transfers and launch overhead dominate
+GPU_MIN_COMBOS = 200
+
+# Threads per block for the grid kernels
+_BLOCK_SIZE = 128
+
+# One thread per (period, threshold pair); same rules as _rsi_grid_kernel.
+# Contraction into FMA is disabled so profits match the CPU kernels exactly.
+_RSI_GRID_SOURCE = r'''
+extern "C" __global__
+void rsi_grid(const double* close, const double* rsi, const double* oversold,
+              const double* overbought, const int n_bars, const int n_pairs,
+              const int n_combos, const double position_size,
+              long long* signals, long long* trades, long long* wins, double* total_profit)
+{
+    int k = blockDim.x * blockIdx.x + threadIdx.x;
+    if (k >= n_combos) return;
+    
+    const double* r = rsi + (long long)(k / n_pairs) * n_bars;
+    const double lo = oversold[k % n_pairs];
+    const double hi = overbought[k % n_pairs];
+    
+    bool in_position = false;
+    double entry = 0.0;
+    long long n_signals = 0, n_trades = 0, n_wins = 0;
+    double total = 0.0;
+    
+    for (int i = 0; i < n_bars; i++) {
+        if (r[i] <= lo) {
+            n_signals++;
+            if (!in_position) {
+                in_position = true;
+                entry = close[i];
+            }
+        } else if (r[i] >= hi) {
+            n_signals++;
+            if (in_position) {
+                double profit = (((close[i] - entry) / entry) * 100 / 100) * position_size;
+                total += profit;
+                n_trades++;
+                if (profit > 0) n_wins++;
+                in_position = false;
+            }
+        }
+    }
+    
+    signals[k] = n_signals;
+    trades[k] = n_trades;
+    wins[k] = n_wins;
+    total_profit[k] = total;
+}
+'''
+
+_rsi_grid = None
+
+
+def rsi_grid_gpu(close: np.ndarray, rsi: np.ndarray, oversold: np.ndarray,
+                 overbought: np.ndarray, position_size: float) -> tuple:
+    """
+    Simulate the RSI strategy for every (period, threshold pair) on the GPU
+    
+    Args:
+        close: Close prices (float64)
+        rsi: 2-D array of RSI values, one row per period (float64)
+        oversold: Oversold threshold per pair
+        overbought: Overbought threshold per pair (same length as oversold)
+        position_size: Position size in USD
+        
+    Returns:
+        Tuple of (signals, trades, winning_trades, total_profit) NumPy arrays
+        shaped (n_periods, n_pairs)
+    """
+    global _rsi_grid
+    if _rsi_grid is None:
+        _rsi_grid = cp.RawKernel(_RSI_GRID_SOURCE, 'rsi_grid', options=('--fmad=false',))
+    
+    n_periods, n_bars = rsi.shape
+    n_pairs = oversold.shape[0]
+    n_combos = n_periods * n_pairs
+    
+    signals = cp.zeros(n_combos, dtype=cp.int64)
+    trades = cp.zeros(n_combos, dtype=cp.int64)
+    wins = cp.zeros(n_combos, dtype=cp.int64)
+    total_profit = cp.zeros(n_combos, dtype=cp.float64)
+    
+    blocks = (n_combos + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+    _rsi_grid((blocks,), (_BLOCK_SIZE,), (
+        cp.asarray(close, dtype=cp.float64), cp.asarray(np.ascontiguousarray(rsi), dtype=cp.float64),
+        cp.asarray(oversold, dtype=cp.float64), cp.asarray(overbought, dtype=cp.float64),
+        np.int32(n_bars), np.int32(n_pairs), np.int32(n_combos), np.float64(position_size),
+        signals, trades, wins, total_profit
+    ))
+    
+    shape = (n_periods, n_pairs)
+    return tuple(cp.asnumpy(arr).reshape(shape) for arr in (signals, trades, wins, total_profit))
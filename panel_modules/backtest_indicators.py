@@ -1,12 +1,137 @@
 """
 Technical indicators for backtesting
 """
+import numpy as np
 import pandas as pd
+from ._njit import njit
+
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+
+@njit(cache=True)
+def _rsi_loop(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder-smoothed RSI in a single pass
+    
+    Seeds the average gain/loss with the simple mean of the first ``period``
+    price changes, then updates them recursively:
+    avg = (avg * (period - 1) + new) / period
+    
+    Args:
+        prices: Array of prices
+        period: RSI period
+        
+    Returns:
+        Array of RSI values (NaN until enough data is available)
+    """
+    n = prices.shape[0]
+    out = np.full(n, np.nan)
+    if period < 1 or n <= period:
+        return out
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+    
+    for i in range(period, n):
+        if i > period:
+            delta = prices[i] - prices[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    
+    return out
+
+
+@njit(cache=True)
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean using a running sum
+    
+    Args:
+        values: Array of values
+        window: Window length
+        
+    Returns:
+        Array of means (NaN for the first window - 1 rows)
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    
+    for i in range(n):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    
+    return out
+
+
+@njit(cache=True)
+def _macd_kernel(prices: np.ndarray, fast: int, slow: int, signal: int) -> tuple:
+    """
+    Fast/slow EMAs, MACD line and signal line in a single pass
+    
+    Each EMA is seeded with its first input, matching ewm(adjust=False).
+    
+    Args:
+        prices: Array of prices
+        fast: Fast EMA period
+        slow: Slow EMA period
+        signal: Signal line period
+        
+    Returns:
+        Tuple of (macd_line, signal_line, histogram) arrays
+    """
+    n = prices.shape[0]
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    histogram = np.empty(n)
+    if n == 0:
+        return macd_line, signal_line, histogram
+    
+    a_fast = 2.0 / (fast + 1)
+    a_slow = 2.0 / (slow + 1)
+    a_signal = 2.0 / (signal + 1)
+    
+    ema_fast = prices[0]
+    ema_slow = prices[0]
+    sig = 0.0
+    for i in range(n):
+        if i > 0:
+            ema_fast = a_fast * prices[i] + (1.0 - a_fast) * ema_fast
+            ema_slow = a_slow * prices[i] + (1.0 - a_slow) * ema_slow
+        line = ema_fast - ema_slow
+        sig = line if i == 0 else a_signal * line + (1.0 - a_signal) * sig
+        macd_line[i] = line
+        signal_line[i] = sig
+        histogram[i] = line - sig
+    
+    return macd_line, signal_line, histogram
 
 
 def calculate_rsi(prices: pd.Series, period: int) -> pd.Series:
     """
-    Calculate RSI indicator
+    Calculate RSI indicator (Wilder's smoothing)
     
     Args:
         prices: Series of prices
@@ -15,14 +140,13 @@ def calculate_rsi(prices: pd.Series, period: int) -> pd.Series:
     Returns:
         Series of RSI values
     """
-    deltas = prices.diff()
-    gain = (deltas.where(deltas > 0, 0)).rolling(window=period).mean()
-    loss = (-deltas.where(deltas < 0, 0)).rolling(window=period).mean()
-    
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
+    # Accumulate in double precision, hand back the caller's dtype
+    values = prices.to_numpy(dtype=np.float64)
+    if TALIB_AVAILABLE:
+        rsi = talib.RSI(values, timeperiod=period)
+    else:
+        rsi = _rsi_loop(values, period)
+    return pd.Series(rsi.astype(prices.dtype, copy=False), index=prices.index)
 
 
 def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
@@ -36,6 +160,9 @@ def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
     Returns:
         Series of SMA values
     """
+    if TALIB_AVAILABLE:
+        sma = talib.SMA(prices.to_numpy(dtype=np.float64), timeperiod=period)
+        return pd.Series(sma.astype(prices.dtype, copy=False), index=prices.index)
     return prices.rolling(window=period).mean()
 
 
@@ -66,13 +193,13 @@ def calculate_macd(prices: pd.Series, fast: int, slow: int, signal: int) -> tupl
     Returns:
         Tuple of (macd_line, signal_line, histogram)
     """
-    ema_fast = calculate_ema(prices, fast)
-    ema_slow = calculate_ema(prices, slow)
-    macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    histogram = macd_line - signal_line
-    
-    return macd_line, signal_line, histogram
+    macd_line, signal_line, histogram = _macd_kernel(
+        prices.to_numpy(dtype=np.float64), fast, slow, signal
+    )
+    dtype = prices.dtype
+    return (pd.Series(macd_line.astype(dtype, copy=False), index=prices.index),
+            pd.Series(signal_line.astype(dtype, copy=False), index=prices.index),
+            pd.Series(histogram.astype(dtype, copy=False), index=prices.index))
 
 
 def calculate_volume_spike(volume: pd.Series, multiplier: float, window: int = 20) -> pd.Series:
@@ -87,8 +214,9 @@ def calculate_volume_spike(volume: pd.Series, multiplier: float, window: int = 2
     Returns:
         Series of boolean values indicating volume spikes
     """
-    avg_volume = volume.rolling(window=window).mean()
-    return volume > (avg_volume * multiplier)
+    values = volume.to_numpy(dtype=np.float64)
+    avg_volume = _rolling_mean(values, window)
+    return pd.Series(values > (avg_volume * multiplier), index=volume.index)
 
 
 def calculate_bollinger_bands(prices: pd.Series, period: int, std_dev: float) -> tuple:
@@ -103,6 +231,17 @@ def calculate_bollinger_bands(prices: pd.Series, period: int, std_dev: float) ->
     Returns:
         Tuple of (middle_band, upper_band, lower_band)
     """
+    if TALIB_AVAILABLE and period > 1:
+        # BBANDS uses the population std; rescale to match pandas' sample std
+        nbdev = std_dev * np.sqrt(period / (period - 1))
+        upper, middle, lower = talib.BBANDS(prices.to_numpy(dtype=np.float64),
+                                            timeperiod=period, nbdevup=nbdev,
+                                            nbdevdn=nbdev, matype=0)
+        dtype = prices.dtype
+        return (pd.Series(middle.astype(dtype, copy=False), index=prices.index),
+                pd.Series(upper.astype(dtype, copy=False), index=prices.index),
+                pd.Series(lower.astype(dtype, copy=False), index=prices.index))
+    
     middle_band = prices.rolling(window=period).mean()
     std = prices.rolling(window=period).std()
     upper_band = middle_band + (std * std_dev)
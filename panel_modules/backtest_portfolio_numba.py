@@ -0,0 +1,468 @@
+"""
+Compiled single-pass portfolio simulation for backtesting
+"""
+import numpy as np
+from typing import Optional, Dict
+from ._njit import njit
+
+
+@njit(cache=True, nogil=True)
+def simulate_signals(close: np.ndarray, entries: np.ndarray, exits: np.ndarray,
+                     position_size: float, fee: float = 0.0) -> tuple:
+    """
+    Simulate a long-only strategy from entry/exit masks in one pass
+    
+    An entry opens a position when flat and an exit closes it when long; a bar
+    flagged as both counts as an entry.
+    
+    Args:
+        close: Close prices (float64)
+        entries: Boolean entry mask
+        exits: Boolean exit mask
+        position_size: Position size in USD
+        fee: Fee per side as a fraction of the position size
+        
+    Returns:
+        Tuple of (total_trades, winning_trades, total_profit_usd)
+    """
+    in_position = False
+    entry = 0.0
+    n_trades = 0
+    n_wins = 0
+    total = 0.0
+    
+    for i in range(close.shape[0]):
+        if entries[i]:
+            if not in_position:
+                in_position = True
+                entry = close[i]
+        elif exits[i]:
+            if in_position:
+                profit = (((close[i] - entry) / entry) * 100 / 100) * position_size
+                profit -= 2 * fee * position_size
+                total += profit
+                n_trades += 1
+                if profit > 0:
+                    n_wins += 1
+                in_position = False
+    
+    return n_trades, n_wins, total
+
+
+
+@njit(cache=True, nogil=True)
+def simulate_rsi_fused(close: np.ndarray, period: int, oversold: float, overbought: float,
+                       position_size: float) -> tuple:
+    """
+    RSI strategy with the Wilder RSI update and the trade loop fused
+    
+    Same rules and RSI seeding as run_rsi_backtest / _rsi_loop, but the RSI of
+    each bar lives only in a local, so no indicator or mask arrays are built.
+    
+    Args:
+        close: Close prices (float64)
+        period: RSI period
+        oversold: BUY when RSI <= oversold
+        overbought: SELL when RSI >= overbought
+        position_size: Position size in USD
+        
+    Returns:
+        Tuple of (signals_generated, total_trades, winning_trades, total_profit_usd)
+    """
+    n = close.shape[0]
+    n_signals = 0
+    n_trades = 0
+    n_wins = 0
+    total = 0.0
+    if period < 1 or n <= period:
+        return n_signals, n_trades, n_wins, total
+    
+    in_position = False
+    entry = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if i <= period:
+            if delta > 0:
+                avg_gain += delta
+            else:
+                avg_loss -= delta
+            if i < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        if avg_loss > 0:
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi = 100.0
+        else:
+            continue
+        
+        if rsi <= oversold:
+            n_signals += 1
+            if not in_position:
+                in_position = True
+                entry = close[i]
+        elif rsi >= overbought:
+            n_signals += 1
+            if in_position:
+                profit = (((close[i] - entry) / entry) * 100 / 100) * position_size
+                total += profit
+                n_trades += 1
+                if profit > 0:
+                    n_wins += 1
+                in_position = False
+    
+    return n_signals, n_trades, n_wins, total
+
+
+@njit(cache=True, nogil=True)
+def simulate_sma_fused(close: np.ndarray, short_period: int, long_period: int,
+                       position_size: float) -> tuple:
+    """
+    SMA crossover strategy with both running sums and the trade loop fused
+    
+    BUY when the short SMA crosses above the long SMA, SELL when it crosses
+    below; the first bar with both SMAs has no previous value and never signals.
+    The running sums follow pandas' rolling mean (Kahan-compensated adds and
+    removes, and the exact price over a window of equal closes), so flat
+    stretches tie and cross on the same bars as rolling().mean().
+    
+    Args:
+        close: Close prices (float64)
+        short_period: Short SMA period
+        long_period: Long SMA period
+        position_size: Position size in USD
+        
+    Returns:
+        Tuple of (signals_generated, total_trades, winning_trades, total_profit_usd)
+    """
+    n = close.shape[0]
+    n_signals = 0
+    n_trades = 0
+    n_wins = 0
+    total = 0.0
+    if short_period < 1 or long_period < 1:
+        return n_signals, n_trades, n_wins, total
+    
+    start = max(short_period, long_period) - 1
+    in_position = False
+    entry = 0.0
+    sum_short = 0.0
+    sum_long = 0.0
+    # Kahan compensation terms, kept apart for adds and removes
+    add_short = 0.0
+    remove_short = 0.0
+    add_long = 0.0
+    remove_long = 0.0
+    same_run = 0  # Number of equal closes ending at bar i
+    prev_short = 0.0
+    prev_long = 0.0
+    
+    for i in range(n):
+        if i >= short_period:
+            y = -close[i - short_period] - remove_short
+            t = sum_short + y
+            remove_short = t - sum_short - y
+            sum_short = t
+        if i >= long_period:
+            y = -close[i - long_period] - remove_long
+            t = sum_long + y
+            remove_long = t - sum_long - y
+            sum_long = t
+        
+        y = close[i] - add_short
+        t = sum_short + y
+        add_short = t - sum_short - y
+        sum_short = t
+        y = close[i] - add_long
+        t = sum_long + y
+        add_long = t - sum_long - y
+        sum_long = t
+        
+        same_run = same_run + 1 if i > 0 and close[i] == close[i - 1] else 1
+        if i < start:
+            continue
+        
+        sma_short = close[i] if same_run >= short_period else sum_short / short_period
+        sma_long = close[i] if same_run >= long_period else sum_long / long_period
+        if i > start:
+            if prev_short <= prev_long and sma_short > sma_long:
+                n_signals += 1
+                if not in_position:
+                    in_position = True
+                    entry = close[i]
+            elif prev_short >= prev_long and sma_short < sma_long:
+                n_signals += 1
+                if in_position:
+                    profit = (((close[i] - entry) / entry) * 100 / 100) * position_size
+                    total += profit
+                    n_trades += 1
+                    if profit > 0:
+                        n_wins += 1
+                    in_position = False
+        prev_short = sma_short
+        prev_long = sma_long
+    
+    return n_signals, n_trades, n_wins, total
+
+
+@njit(cache=True, nogil=True)
+def simulate_macd_fused(close: np.ndarray, fast: int, slow: int, signal: int,
+                        position_size: float) -> tuple:
+    """
+    MACD strategy with the three EMAs and the trade loop fused
+    
+    BUY when the histogram crosses above zero, SELL when it crosses below.
+    EMAs are seeded with the first price, matching _macd_kernel.
+    
+    Args:
+        close: Close prices (float64)
+        fast: Fast EMA period
+        slow: Slow EMA period
+        signal: Signal line period
+        position_size: Position size in USD
+        
+    Returns:
+        Tuple of (signals_generated, total_trades, winning_trades, total_profit_usd)
+    """
+    n = close.shape[0]
+    n_signals = 0
+    n_trades = 0
+    n_wins = 0
+    total = 0.0
+    if n == 0:
+        return n_signals, n_trades, n_wins, total
+    
+    a_fast = 2.0 / (fast + 1)
+    a_slow = 2.0 / (slow + 1)
+    a_signal = 2.0 / (signal + 1)
+    
+    in_position = False
+    entry = 0.0
+    ema_fast = close[0]
+    ema_slow = close[0]
+    sig = ema_fast - ema_slow
+    prev_hist = 0.0
+    
+    for i in range(1, n):
+        ema_fast = a_fast * close[i] + (1.0 - a_fast) * ema_fast
+        ema_slow = a_slow * close[i] + (1.0 - a_slow) * ema_slow
+        line = ema_fast - ema_slow
+        sig = a_signal * line + (1.0 - a_signal) * sig
+        hist = line - sig
+        
+        if prev_hist <= 0 and hist > 0:
+            n_signals += 1
+            if not in_position:
+                in_position = True
+                entry = close[i]
+        elif prev_hist >= 0 and hist < 0:
+            n_signals += 1
+            if in_position:
+                profit = (((close[i] - entry) / entry) * 100 / 100) * position_size
+                total += profit
+                n_trades += 1
+                if profit > 0:
+                    n_wins += 1
+                in_position = False
+        prev_hist = hist
+    
+    return n_signals, n_trades, n_wins, total
+
+
+
+@njit(cache=True, nogil=True)
+def simulate_macd_signal(close: np.ndarray, macd_line: np.ndarray, signal: int,
+                         position_size: float) -> tuple:
+    """
+    MACD strategy on a precomputed MACD line
+    
+    Same rules as simulate_macd_fused; the signal EMA and histogram are
+    updated in the trade loop, so sweeps can share one MACD line across all
+    signal periods.
+    
+    Args:
+        close: Close prices (float64)
+        macd_line: Fast EMA minus slow EMA (float64)
+        signal: Signal line period
+        position_size: Position size in USD
+        
+    Returns:
+        Tuple of (signals_generated, total_trades, winning_trades, total_profit_usd)
+    """
+    n = close.shape[0]
+    n_signals = 0
+    n_trades = 0
+    n_wins = 0
+    total = 0.0
+    if n == 0:
+        return n_signals, n_trades, n_wins, total
+    
+    a_signal = 2.0 / (signal + 1)
+    in_position = False
+    entry = 0.0
+    sig = macd_line[0]
+    prev_hist = 0.0
+    
+    for i in range(1, n):
+        line = macd_line[i]
+        sig = a_signal * line + (1.0 - a_signal) * sig
+        hist = line - sig
+        
+        if prev_hist <= 0 and hist > 0:
+            n_signals += 1
+            if not in_position:
+                in_position = True
+                entry = close[i]
+        elif prev_hist >= 0 and hist < 0:
+            n_signals += 1
+            if in_position:
+                profit = (((close[i] - entry) / entry) * 100 / 100) * position_size
+                total += profit
+                n_trades += 1
+                if profit > 0:
+                    n_wins += 1
+                in_position = False
+        prev_hist = hist
+    
+    return n_signals, n_trades, n_wins, total
+
+@njit(cache=True, nogil=True)
+def simulate_scalping_fused(close: np.ndarray, volume: np.ndarray, fast_ema: int,
+                            slow_ema: int, rsi_period: int, rsi_oversold: float,
+                            rsi_overbought: float, volume_multiplier: float,
+                            position_size: float, volume_window: int = 20) -> tuple:
+    """
+    Scalping strategy with EMAs, RSI, volume filter and trade loop fused
+    
+    Same rules as _scalping_signals: BUY on a fast-over-slow EMA crossover and
+    SELL on a fast-under-slow crossover, both only with RSI strictly between the
+    thresholds and volume above volume_multiplier times its rolling mean.
+    
+    Args:
+        close: Close prices (float64)
+        volume: Volumes (float64)
+        fast_ema: Fast EMA period
+        slow_ema: Slow EMA period
+        rsi_period: RSI period
+        rsi_oversold: RSI oversold threshold
+        rsi_overbought: RSI overbought threshold
+        volume_multiplier: Volume spike multiplier
+        position_size: Position size in USD
+        volume_window: Rolling window for the average volume
+        
+    Returns:
+        Tuple of (signals_generated, total_trades, winning_trades, total_profit_usd)
+    """
+    n = close.shape[0]
+    n_signals = 0
+    n_trades = 0
+    n_wins = 0
+    total = 0.0
+    if n == 0 or rsi_period < 1:
+        return n_signals, n_trades, n_wins, total
+    
+    a_fast = 2.0 / (fast_ema + 1)
+    a_slow = 2.0 / (slow_ema + 1)
+    
+    in_position = False
+    entry = 0.0
+    fast = close[0]
+    slow = close[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+    volume_sum = volume[0]
+    
+    for i in range(1, n):
+        prev_fast = fast
+        prev_slow = slow
+        fast = a_fast * close[i] + (1.0 - a_fast) * fast
+        slow = a_slow * close[i] + (1.0 - a_slow) * slow
+        
+        volume_sum += volume[i]
+        if i >= volume_window:
+            volume_sum -= volume[i - volume_window]
+        
+        delta = close[i] - close[i - 1]
+        if i <= rsi_period:
+            if delta > 0:
+                avg_gain += delta
+            else:
+                avg_loss -= delta
+            if i < rsi_period:
+                continue
+            avg_gain /= rsi_period
+            avg_loss /= rsi_period
+        else:
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+        
+        if avg_loss > 0:
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi = 100.0
+        else:
+            continue
+        
+        if i < volume_window - 1 or not volume[i] > (volume_sum / volume_window) * volume_multiplier:
+            continue
+        if not (rsi_oversold < rsi < rsi_overbought):
+            continue
+        
+        if prev_fast <= prev_slow and fast > slow:
+            n_signals += 1
+            if not in_position:
+                in_position = True
+                entry = close[i]
+        elif prev_fast >= prev_slow and fast < slow:
+            n_signals += 1
+            if in_position:
+                profit = (((close[i] - entry) / entry) * 100 / 100) * position_size
+                total += profit
+                n_trades += 1
+                if profit > 0:
+                    n_wins += 1
+                in_position = False
+    
+    return n_signals, n_trades, n_wins, total
+
+
+def statistics_from_totals(total_trades: int, winning_trades: int,
+                           total_profit: float) -> Optional[Dict]:
+    """
+    Build the trade statistics dictionary from simulator totals
+    
+    Args:
+        total_trades: Number of completed trades
+        winning_trades: Number of trades with positive profit
+        total_profit: Summed profit in USD
+        
+    Returns:
+        Dictionary in the calculate_trade_statistics format or None if no trades
+    """
+    n = int(total_trades)
+    if n == 0:
+        return None
+    
+    winning = int(winning_trades)
+    total = float(total_profit)
+    
+    return {
+        'total_trades': n,
+        'winning_trades': winning,
+        'losing_trades': n - winning,
+        'win_rate': (winning / n) * 100,
+        'total_profit_usd': total,
+        'avg_profit': total / n
+    }
@@ -3,11 +3,56 @@ Results management for backtesting
 """
 import os
 import json
+import numpy as np
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Optional
+from .backtest_types import BacktestResult
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def save_best_results(all_results: List[Dict], signal_name: str, 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Compact per-result columns used for ranking; coin_idx numbers the coins in order of
+# first appearance and combo_idx points back into the result list
+RESULT_DTYPE = np.dtype([
+    ('coin_idx', 'i4'),
+    ('combo_idx', 'i4'),
+    ('total_profit_usd', 'f8'),
+    ('total_trades', 'i4'),
+    ('win_rate', 'f8')
+])
+
+
+def results_to_array(results: List[BacktestResult]) -> np.ndarray:
+    """
+    Copy the ranking columns of backtest results into a structured array
+    
+    Args:
+        results: List of backtest results
+        
+    Returns:
+        Structured array of RESULT_DTYPE, one row per result in list order
+    """
+    coin_codes = {}
+    arr = np.empty(len(results), dtype=RESULT_DTYPE)
+    arr['coin_idx'] = [coin_codes.setdefault(result['coin'], len(coin_codes)) for result in results]
+    arr['combo_idx'] = np.arange(len(results))
+    arr['total_profit_usd'] = [result['total_profit_usd'] for result in results]
+    arr['total_trades'] = [result['total_trades'] for result in results]
+    arr['win_rate'] = [result['win_rate'] for result in results]
+    return arr
+
+
+def save_best_results(all_results: List[BacktestResult], signal_name: str, 
                      timerange: str, position_size: float) -> None:
     """
     Save best results for each coin to results folder
@@ -22,7 +67,9 @@ def save_best_results(all_results: List[Dict], signal_name: str,
         results_dir = "results"
         os.makedirs(results_dir, exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        backtest_date = now.isoformat()
         
         # Group results by coin and get best for each
         coins_best = {}
@@ -40,7 +87,7 @@ def save_best_results(all_results: List[Dict], signal_name: str,
                 'coin': coin,
                 'signal': signal_name,
                 'timestamp': timestamp,
-                'backtest_date': datetime.now().isoformat(),
+                'backtest_date': backtest_date,
                 'timerange': timerange,
                 'position_size_usd': position_size,
                 'best_parameters': {
@@ -59,8 +106,12 @@ def save_best_results(all_results: List[Dict], signal_name: str,
                 }
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(save_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(save_data, f, indent=2)
             
             print(f"Saved best result for {coin} to {filepath}")
         
@@ -72,23 +123,71 @@ def save_best_results(all_results: List[Dict], signal_name: str,
         traceback.print_exc()
 
 
-def group_best_results_by_coin(results: List[Dict]) -> List[Dict]:
+def save_all_results(all_results: List[BacktestResult], signal_name: str,
+                     results_dir: str = "results") -> Optional[str]:
+    """
+    Save every tested combination to a zstd-compressed Parquet file
+    
+    The per-coin JSON files from save_best_results stay the source for live
+    trading; this keeps the full grid for later analysis
+    (pd.read_parquet(path, engine='pyarrow')). Skipped when pyarrow is missing.
+    
+    Args:
+        all_results: List of all backtest results
+        signal_name: Name of the signal being tested
+        results_dir: Output directory
+        
+    Returns:
+        Path of the written file or None
+    """
+    if not PYARROW_AVAILABLE or not all_results:
+        return None
+    
+    try:
+        os.makedirs(results_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(results_dir, f"{signal_name}_{timestamp}_all.parquet")
+        
+        table = pa.Table.from_pydict({key: np.asarray([result[key] for result in all_results])
+                                      for key in all_results[0]})
+        pq.write_table(table, filepath, compression='zstd')
+        
+        print(f"Saved {len(all_results)} results to {filepath}")
+        return filepath
+        
+    except Exception as e:
+        print(f"Error saving full results: {e}")
+        return None
+
+
+def group_best_results_by_coin(results: List[BacktestResult]) -> List[BacktestResult]:
     """
     Group results by coin and return best for each
     
+    Finds each coin's maximum in one pass over a structured array instead of
+    sorting every result; only the per-coin winners are sorted and looked up
+    again as dictionaries.
+    
     Args:
         results: List of all backtest results
         
     Returns:
-        List of best results per coin, sorted by profit
+        List of best results per coin, sorted by profit (ties keep list order)
     """
-    coins_best = {}
-    for result in results:
-        coin = result['coin']
-        if coin not in coins_best or result['total_profit_usd'] > coins_best[coin]['total_profit_usd']:
-            coins_best[coin] = result
+    if not results:
+        return []
+    
+    arr = results_to_array(results)
+    codes = arr['coin_idx']
+    profit = arr['total_profit_usd']
+    
+    best_profit = np.full(codes.max() + 1, -np.inf)
+    np.maximum.at(best_profit, codes, profit)
     
-    best_per_coin = list(coins_best.values())
-    best_per_coin.sort(key=lambda x: x['total_profit_usd'], reverse=True)
+    # Earliest row reaching its coin's maximum
+    winners = np.flatnonzero(profit == best_profit[codes])
+    _, first = np.unique(codes[winners], return_index=True)
+    best = np.sort(winners[first])
+    best = best[np.argsort(-profit[best], kind='stable')]
     
-    return best_per_coin
+    return [results[i] for i in arr['combo_idx'][best].tolist()]
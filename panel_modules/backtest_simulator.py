@@ -1,77 +1,111 @@
 """
 Trade simulation utilities for backtesting
 """
-from typing import List, Dict, Optional
+import numpy as np
+from typing import Dict, Optional
 
 
-def simulate_trades(signals: List[Dict], position_size: float) -> List[Dict]:
+# Signal actions
+ACTION_BUY = 0
+ACTION_SELL = 1
+
+# One row per detected signal
+SIGNAL_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[ns]'),
+    ('price', 'f8'),
+    ('rsi', 'f8'),
+    ('action', 'i1')
+])
+
+# One row per completed trade
+TRADE_DTYPE = np.dtype([
+    ('entry_time', 'datetime64[ns]'),
+    ('entry_price', 'f8'),
+    ('exit_time', 'datetime64[ns]'),
+    ('exit_price', 'f8'),
+    ('pnl_pct', 'f8'),
+    ('profit_usd', 'f8')
+])
+
+
+def _pair_signals(actions: np.ndarray) -> tuple:
     """
-    Simulate trades based on signals with USD position size
+    Pair entry/exit signal indices for a long-only position
+    
+    A BUY opens a position only when flat and a SELL closes it only when long,
+    so trades are the starts of alternating BUY/SELL runs.
     
     Args:
-        signals: List of signal dictionaries with 'action', 'price', 'timestamp', 'rsi'
-        position_size: Position size in USD
+        actions: int8 array of ACTION_BUY / ACTION_SELL codes
         
     Returns:
-        List of completed trades with P&L
+        Tuple of (entry_idx, exit_idx) arrays
     """
-    trades = []
-    position = None
+    if actions.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    
+    run_starts = np.flatnonzero(np.diff(actions, prepend=np.int8(-1)) != 0)
+    if actions[0] == ACTION_SELL:
+        run_starts = run_starts[1:]
     
-    for signal in signals:
-        if signal['action'] == 'BUY' and position is None:
-            # Open long position
-            position = {
-                'entry_time': signal['timestamp'],
-                'entry_price': signal['price'],
-                'entry_rsi': signal['rsi'],
-                'size_usd': position_size
-            }
+    exit_idx = run_starts[1::2]
+    entry_idx = run_starts[0::2][:exit_idx.size]
+    return entry_idx, exit_idx
+
+
+def simulate_trades(signals: np.ndarray, position_size: float) -> np.ndarray:
+    """
+    Simulate trades based on signals with USD position size
+    
+    Args:
+        signals: Structured array of SIGNAL_DTYPE
+        position_size: Position size in USD
         
-        elif signal['action'] == 'SELL' and position is not None:
-            # Close position
-            pnl_pct = ((signal['price'] - position['entry_price']) / position['entry_price']) * 100
-            profit_usd = (pnl_pct / 100) * position['size_usd']
-            
-            trades.append({
-                'entry_time': position['entry_time'],
-                'entry_price': position['entry_price'],
-                'exit_time': signal['timestamp'],
-                'exit_price': signal['price'],
-                'pnl_pct': pnl_pct,
-                'profit_usd': profit_usd
-            })
-            
-            position = None
+    Returns:
+        Structured array of TRADE_DTYPE with completed trades and P&L
+    """
+    entry_idx, exit_idx = _pair_signals(signals['action'])
+    entries = signals[entry_idx]
+    exits = signals[exit_idx]
     
+    trades = np.empty(exit_idx.size, dtype=TRADE_DTYPE)
+    trades['entry_time'] = entries['timestamp']
+    trades['entry_price'] = entries['price']
+    trades['exit_time'] = exits['timestamp']
+    trades['exit_price'] = exits['price']
+    trades['pnl_pct'] = ((exits['price'] - entries['price']) / entries['price']) * 100
+    trades['profit_usd'] = (trades['pnl_pct'] / 100) * position_size
     return trades
 
 
-def calculate_trade_statistics(trades: List[Dict]) -> Optional[Dict]:
+def calculate_trade_statistics(trades) -> Optional[Dict]:
     """
     Calculate statistics from completed trades
     
     Args:
-        trades: List of completed trades
+        trades: Structured array of TRADE_DTYPE, float array of per-trade profits,
+                or list of trade dictionaries with 'profit_usd'
         
     Returns:
         Dictionary with trade statistics or None if no trades
     """
-    if not trades:
-        return None
+    if isinstance(trades, np.ndarray):
+        profits = trades['profit_usd'] if trades.dtype.names else trades
+    else:
+        profits = np.array([t['profit_usd'] for t in trades], dtype=np.float64)
     
-    winning_trades = [t for t in trades if t['profit_usd'] > 0]
-    losing_trades = [t for t in trades if t['profit_usd'] <= 0]
+    n = profits.size
+    if n == 0:
+        return None
     
-    total_profit = sum(t['profit_usd'] for t in trades)
-    win_rate = (len(winning_trades) / len(trades)) * 100 if trades else 0
-    avg_profit = total_profit / len(trades) if trades else 0
+    winning = int(np.count_nonzero(profits > 0))
+    total_profit = float(profits.sum())
     
     return {
-        'total_trades': len(trades),
-        'winning_trades': len(winning_trades),
-        'losing_trades': len(losing_trades),
-        'win_rate': win_rate,
+        'total_trades': n,
+        'winning_trades': winning,
+        'losing_trades': n - winning,
+        'win_rate': (winning / n) * 100,
         'total_profit_usd': total_profit,
-        'avg_profit': avg_profit
+        'avg_profit': total_profit / n
     }
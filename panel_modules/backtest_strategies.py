@@ -1,17 +1,205 @@
 """
 Strategy-specific backtest implementations
 """
+import itertools
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, List
+from typing import Optional, List
 from .backtest_indicators import (
     calculate_rsi, calculate_sma, calculate_ema, 
-    calculate_macd, calculate_volume_spike, calculate_bollinger_bands
+    calculate_volume_spike, calculate_bollinger_bands, _macd_kernel, _rsi_loop
 )
-from .backtest_simulator import simulate_trades, calculate_trade_statistics
+from .backtest_simulator import (
+    SIGNAL_DTYPE, ACTION_BUY, ACTION_SELL,
+    simulate_trades, calculate_trade_statistics
+)
+from .backtest_portfolio_numba import (
+    simulate_signals, simulate_rsi_fused, simulate_sma_fused, simulate_macd_fused,
+    simulate_macd_signal, simulate_scalping_fused, statistics_from_totals
+)
+from .backtest_gpu import CUPY_AVAILABLE, GPU_MIN_COMBOS, rsi_grid_gpu
+from .backtest_types import BacktestResult
+from ._njit import njit, prange
+
+
+def _build_signals(idx: np.ndarray, is_buy: np.ndarray, ts: np.ndarray,
+                   close: np.ndarray, rsi: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Build the signal array for the given row indices
+    
+    Args:
+        idx: Row indices where a signal fired
+        is_buy: Boolean array (aligned with idx) - True for BUY, False for SELL
+        ts: Timestamp array
+        close: Close price array
+        rsi: Optional RSI array (0 is reported when omitted)
+        
+    Returns:
+        Structured array of SIGNAL_DTYPE
+    """
+    signals = np.empty(len(idx), dtype=SIGNAL_DTYPE)
+    signals['timestamp'] = ts[idx]
+    signals['price'] = close[idx]
+    signals['rsi'] = rsi[idx] if rsi is not None else 0
+    signals['action'] = np.where(is_buy, ACTION_BUY, ACTION_SELL)
+    return signals
+
+
+def _previous(values: np.ndarray) -> np.ndarray:
+    """
+    Shift an indicator array one row forward (NaN for the first row)
+    
+    Args:
+        values: Float indicator array
+        
+    Returns:
+        Array where element i holds values[i-1]
+    """
+    prev = np.empty_like(values)
+    if len(values):
+        prev[0] = np.nan
+        prev[1:] = values[:-1]
+    return prev
+
+
+def _first_valid(*arrays: np.ndarray) -> int:
+    """
+    Find the first row where every indicator array has a value
+    
+    Args:
+        arrays: Float indicator arrays of equal length
+        
+    Returns:
+        Index of the first row without NaNs (array length if there is none)
+    """
+    start = 0
+    for values in arrays:
+        valid = ~np.isnan(values)
+        start = max(start, int(np.argmax(valid)) if valid.any() else len(values))
+    return start
+
+
+@njit(cache=True)
+def _scalping_signals(fast: np.ndarray, slow: np.ndarray, rsi: np.ndarray,
+                      vol_spike: np.ndarray, rsi_oversold: float,
+                      rsi_overbought: float, start: int) -> tuple:
+    """
+    Find scalping entry/exit rows
+    
+    BUY on a fast-over-slow EMA crossover and SELL on a fast-under-slow
+    crossover, both only with RSI strictly between the thresholds and a
+    volume spike on the same bar.
+    
+    Args:
+        fast: Fast EMA array
+        slow: Slow EMA array
+        rsi: RSI array
+        vol_spike: Boolean volume spike array
+        rsi_oversold: RSI oversold threshold
+        rsi_overbought: RSI overbought threshold
+        start: First row with valid indicators
+        
+    Returns:
+        Tuple of (buy_indices, sell_indices)
+    """
+    n = fast.shape[0]
+    buys = np.empty(n, np.int64)
+    sells = np.empty(n, np.int64)
+    nb = 0
+    ns = 0
+    
+    for i in range(max(start, 1), n):
+        if np.isnan(fast[i]) or np.isnan(rsi[i]):
+            continue
+        if not vol_spike[i] or not (rsi_oversold < rsi[i] < rsi_overbought):
+            continue
+        
+        if fast[i-1] <= slow[i-1] and fast[i] > slow[i]:
+            buys[nb] = i
+            nb += 1
+        elif fast[i-1] >= slow[i-1] and fast[i] < slow[i]:
+            sells[ns] = i
+            ns += 1
+    
+    return buys[:nb], sells[:ns]
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _rsi_grid_kernel(close: np.ndarray, rsi: np.ndarray, oversold: np.ndarray,
+                     overbought: np.ndarray, position_size: float) -> tuple:
+    """
+    Simulate the RSI strategy for many threshold pairs over one RSI series
+    
+    Same rules as run_rsi_backtest: BUY when RSI <= oversold, SELL when
+    RSI >= overbought; a BUY opens a position when flat and a SELL closes it.
+    
+    Args:
+        close: Close prices (float64)
+        rsi: RSI values for one period
+        oversold: Oversold threshold per pair
+        overbought: Overbought threshold per pair (same length as oversold)
+        position_size: Position size in USD
+        
+    Returns:
+        Tuple of per-pair arrays (signals, trades, winning_trades, total_profit)
+    """
+    n_pairs = oversold.shape[0]
+    signals = np.zeros(n_pairs, np.int64)
+    trades = np.zeros(n_pairs, np.int64)
+    wins = np.zeros(n_pairs, np.int64)
+    total_profit = np.zeros(n_pairs)
+    
+    for k in prange(n_pairs):
+        lo = oversold[k]
+        hi = overbought[k]
+        in_position = False
+        entry = 0.0
+        n_signals = 0
+        n_trades = 0
+        n_wins = 0
+        total = 0.0
+        
+        for i in range(close.shape[0]):
+            r = rsi[i]
+            if r <= lo:
+                n_signals += 1
+                if not in_position:
+                    in_position = True
+                    entry = close[i]
+            elif r >= hi:
+                n_signals += 1
+                if in_position:
+                    profit = (((close[i] - entry) / entry) * 100 / 100) * position_size
+                    total += profit
+                    n_trades += 1
+                    if profit > 0:
+                        n_wins += 1
+                    in_position = False
+        
+        signals[k] = n_signals
+        trades[k] = n_trades
+        wins[k] = n_wins
+        total_profit[k] = total
+    
+    return signals, trades, wins, total_profit
+
+
+def warmup_kernels() -> None:
+    """Compile (or load from the Numba cache) the backtest kernels on a tiny input"""
+    close = np.linspace(100.0, 101.0, 100)
+    rsi = np.linspace(0.0, 100.0, 100)
+    _rsi_grid_kernel(close, rsi, np.array([30.0]), np.array([70.0]), 100.0)
+    simulate_signals(close, rsi <= 30.0, rsi >= 70.0, 100.0, 0.0)
+    simulate_rsi_fused(close, 14, 30.0, 70.0, 100.0)
+    simulate_sma_fused(close, 5, 20, 100.0)
+    simulate_macd_fused(close, 12, 26, 9, 100.0)
+    simulate_macd_signal(close, close - close.mean(), 9, 100.0)
+    simulate_scalping_fused(close, close, 5, 13, 7, 30.0, 70.0, 1.5, 100.0)
 
 
 def run_rsi_backtest(df: pd.DataFrame, coin: str, period: int, 
-                     oversold: int, overbought: int, position_size: float) -> Optional[Dict]:
+                     oversold: int, overbought: int, position_size: float,
+                     rsi_precomputed: Optional[np.ndarray] = None) -> Optional[BacktestResult]:
     """
     Run RSI-based backtest
     
@@ -22,39 +210,26 @@ def run_rsi_backtest(df: pd.DataFrame, coin: str, period: int,
         oversold: Oversold threshold
         overbought: Overbought threshold
         position_size: Position size in USD
+        rsi_precomputed: Optional RSI array for this period (skips recomputation)
         
     Returns:
         Dictionary with backtest results or None
     """
     try:
-        df_copy = df.copy()
-        df_copy['rsi'] = calculate_rsi(df_copy['close'], period)
-        
-        # Generate signals
-        signals = []
-        for i in range(len(df_copy)):
-            if pd.isna(df_copy.iloc[i]['rsi']):
-                continue
-            
-            rsi = df_copy.iloc[i]['rsi']
-            if rsi <= oversold:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': rsi,
-                    'action': 'BUY'
-                })
-            elif rsi >= overbought:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': rsi,
-                    'action': 'SELL'
-                })
-        
-        # Simulate trades
-        trades = simulate_trades(signals, position_size)
-        stats = calculate_trade_statistics(trades)
+        close = df['close'].to_numpy(dtype=np.float64)
+        if rsi_precomputed is not None:
+            # Signal masks (NaN warm-up rows compare False)
+            entries = rsi_precomputed <= oversold
+            exits = rsi_precomputed >= overbought
+            signals_generated = int(np.count_nonzero(entries | exits))
+            totals = simulate_signals(close, entries, exits, float(position_size))
+        else:
+            # RSI, signals and trades in one pass
+            signals_generated, *totals = simulate_rsi_fused(
+                close, period, float(oversold), float(overbought), float(position_size)
+            )
+        
+        stats = statistics_from_totals(*totals)
         
         if not stats:
             return None
@@ -64,7 +239,7 @@ def run_rsi_backtest(df: pd.DataFrame, coin: str, period: int,
             'period': period,
             'oversold': oversold,
             'overbought': overbought,
-            'signals_generated': len(signals),
+            'signals_generated': int(signals_generated),
             **stats
         }
         
@@ -73,8 +248,69 @@ def run_rsi_backtest(df: pd.DataFrame, coin: str, period: int,
         return None
 
 
+def run_rsi_sweep(df: pd.DataFrame, coin: str, periods: List[int],
+                  oversold_levels: List[int], overbought_levels: List[int],
+                  position_size: float) -> List[BacktestResult]:
+    """
+    Run RSI backtests for every (period, oversold, overbought) combination
+    
+    The thresholds only change the signal masks, so RSI is computed once per
+    period and all threshold pairs are simulated together by a compiled kernel
+    (on the GPU for large grids when CuPy is installed).
+    
+    Args:
+        df: DataFrame with OHLCV data
+        coin: Coin symbol
+        periods: RSI periods to test
+        oversold_levels: Oversold thresholds to test
+        overbought_levels: Overbought thresholds to test
+        position_size: Position size in USD
+        
+    Returns:
+        List of backtest result dictionaries (combinations without trades are skipped)
+    """
+    # RSI rows and prices are float64, like the fused kernel behind run_rsi_backtest,
+    # so a threshold crossing lands on the same bar in both paths
+    close = df['close'].to_numpy(dtype=np.float64)
+    pairs = [(oversold, overbought) for oversold in oversold_levels
+             for overbought in overbought_levels]
+    oversold_arr = np.array([pair[0] for pair in pairs], dtype=np.float64)
+    overbought_arr = np.array([pair[1] for pair in pairs], dtype=np.float64)
+    
+    if not periods or not pairs:
+        return []
+    
+    # The Wilder loop behind simulate_rsi_fused, not TA-Lib (whose RSI is 0 rather
+    # than undefined on flat windows), so each combination signals like run_rsi_backtest
+    rsis = [_rsi_loop(close, period) for period in periods]
+    if CUPY_AVAILABLE and len(periods) * len(pairs) >= GPU_MIN_COMBOS:
+        signals, trades, wins, total_profit = rsi_grid_gpu(
+            close, np.stack(rsis), oversold_arr, overbought_arr, float(position_size)
+        )
+    else:
+        per_period = [_rsi_grid_kernel(close, rsi, oversold_arr, overbought_arr, float(position_size))
+                      for rsi in rsis]
+        signals, trades, wins, total_profit = (np.array(column) for column in zip(*per_period))
+    
+    results = []
+    for p, period in enumerate(periods):
+        for k in np.flatnonzero(trades[p]).tolist():
+            results.append({
+                'coin': coin,
+                'period': period,
+                'oversold': pairs[k][0],
+                'overbought': pairs[k][1],
+                'signals_generated': int(signals[p, k]),
+                **statistics_from_totals(trades[p, k], wins[p, k], total_profit[p, k])
+            })
+    
+    return results
+
+
 def run_sma_backtest(df: pd.DataFrame, coin: str, short_period: int,
-                     long_period: int, position_size: float) -> Optional[Dict]:
+                     long_period: int, position_size: float,
+                     short_precomputed: Optional[np.ndarray] = None,
+                     long_precomputed: Optional[np.ndarray] = None) -> Optional[BacktestResult]:
     """
     Run SMA crossover backtest
     
@@ -84,42 +320,56 @@ def run_sma_backtest(df: pd.DataFrame, coin: str, short_period: int,
         short_period: Short SMA period
         long_period: Long SMA period
         position_size: Position size in USD
+        short_precomputed: Optional short SMA array (skips recomputation)
+        long_precomputed: Optional long SMA array (skips recomputation)
         
     Returns:
         Dictionary with backtest results or None
     """
     try:
-        df_copy = df.copy()
-        df_copy['short_sma'] = calculate_sma(df_copy['close'], short_period)
-        df_copy['long_sma'] = calculate_sma(df_copy['close'], long_period)
+        if short_precomputed is None and long_precomputed is None:
+            # SMAs, signals and trades in one pass
+            signals_generated, *totals = simulate_sma_fused(
+                df['close'].to_numpy(dtype=np.float64), short_period, long_period,
+                float(position_size)
+            )
+            stats = statistics_from_totals(*totals)
+            if not stats:
+                return None
+            return {
+                'coin': coin,
+                'period': short_period,
+                'oversold': long_period,
+                'overbought': 0,
+                'signals_generated': int(signals_generated),
+                **stats
+            }
+        
+        close = df['close'].to_numpy()
+        ts = df['timestamp'].to_numpy()
+        if short_precomputed is not None:
+            short_sma = short_precomputed
+        else:
+            short_sma = calculate_sma(df['close'], short_period).to_numpy()
+        if long_precomputed is not None:
+            long_sma = long_precomputed
+        else:
+            long_sma = calculate_sma(df['close'], long_period).to_numpy()
+        
+        # Skip the warm-up rows; the first kept row has no previous value
+        start = _first_valid(short_sma, long_sma)
+        if start >= len(short_sma):
+            return None
+        short_sma = short_sma[start:]
+        long_sma = long_sma[start:]
+        prev_short = _previous(short_sma)
+        prev_long = _previous(long_sma)
         
-        # Generate signals
-        signals = []
-        for i in range(1, len(df_copy)):
-            if pd.isna(df_copy.iloc[i]['short_sma']) or pd.isna(df_copy.iloc[i]['long_sma']):
-                continue
-            
-            curr_short = df_copy.iloc[i]['short_sma']
-            curr_long = df_copy.iloc[i]['long_sma']
-            prev_short = df_copy.iloc[i-1]['short_sma']
-            prev_long = df_copy.iloc[i-1]['long_sma']
-            
-            # Bullish crossover
-            if prev_short <= prev_long and curr_short > curr_long:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': 0,
-                    'action': 'BUY'
-                })
-            # Bearish crossover
-            elif prev_short >= prev_long and curr_short < curr_long:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': 0,
-                    'action': 'SELL'
-                })
+        # Bullish / bearish crossovers (NaN comparisons are always False)
+        bullish = (prev_short <= prev_long) & (short_sma > long_sma)
+        bearish = (prev_short >= prev_long) & (short_sma < long_sma)
+        idx = np.flatnonzero(bullish | bearish)
+        signals = _build_signals(idx + start, bullish[idx], ts, close)
         
         # Simulate trades
         trades = simulate_trades(signals, position_size)
@@ -142,8 +392,42 @@ def run_sma_backtest(df: pd.DataFrame, coin: str, short_period: int,
         return None
 
 
+def run_sma_sweep(df: pd.DataFrame, coin: str, short_periods: List[int],
+                  long_periods: List[int], position_size: float) -> List[BacktestResult]:
+    """
+    Run SMA crossover backtests for every (short, long) combination
+    
+    Each distinct period's SMA is computed once and shared by all pairs.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        coin: Coin symbol
+        short_periods: Short SMA periods to test
+        long_periods: Long SMA periods to test
+        position_size: Position size in USD
+        
+    Returns:
+        List of backtest result dictionaries (combinations without trades are skipped)
+    """
+    # pandas' rolling mean, as reproduced by simulate_sma_fused (TA-Lib's SMA drifts
+    # on flat stretches), so each pair signals like run_sma_backtest
+    smas = {period: df['close'].rolling(window=period).mean().to_numpy()
+            for period in set(short_periods) | set(long_periods)}
+    
+    results = []
+    for short_period in short_periods:
+        for long_period in long_periods:
+            result = run_sma_backtest(df, coin, short_period, long_period, position_size,
+                                      short_precomputed=smas[short_period],
+                                      long_precomputed=smas[long_period])
+            if result:
+                results.append(result)
+    
+    return results
+
+
 def run_range_backtest(df: pd.DataFrame, coin: str, long_offset: float,
-                       tolerance: float, position_size: float) -> Optional[Dict]:
+                       tolerance: float, position_size: float) -> Optional[BacktestResult]:
     """
     Run range-based backtest
     
@@ -164,39 +448,14 @@ def run_range_backtest(df: pd.DataFrame, coin: str, long_offset: float,
         buy_range_low = period_low * (1 + long_offset / 100)
         buy_range_high = period_low * (1 + long_offset / 100 + tolerance / 100)
         
-        # Generate signals
-        signals = []
-        in_range = False
-        
-        for i in range(len(df)):
-            current_price = df.iloc[i]['close']
-            
-            if not in_range and buy_range_low <= current_price <= buy_range_high:
-                signals.append({
-                    'timestamp': df.iloc[i]['timestamp'],
-                    'price': current_price,
-                    'rsi': 0,
-                    'action': 'BUY'
-                })
-                in_range = True
-            
-            elif in_range and current_price > buy_range_high:
-                signals.append({
-                    'timestamp': df.iloc[i]['timestamp'],
-                    'price': current_price,
-                    'rsi': 0,
-                    'action': 'SELL'
-                })
-                in_range = False
-            
-            elif in_range and current_price < buy_range_low:
-                signals.append({
-                    'timestamp': df.iloc[i]['timestamp'],
-                    'price': current_price,
-                    'rsi': 0,
-                    'action': 'SELL'
-                })
-                in_range = False
+        close = df['close'].to_numpy()
+        ts = df['timestamp'].to_numpy()
+        
+        # The position is open exactly while price sits inside the buy band,
+        # so signals fire where the in-band state flips (BUY on entry, SELL on exit)
+        in_band = (close >= buy_range_low) & (close <= buy_range_high)
+        idx = np.flatnonzero(np.diff(in_band.astype(np.int8), prepend=np.int8(0)))
+        signals = _build_signals(idx, in_band[idx], ts, close)
         
         # Simulate trades
         trades = simulate_trades(signals, position_size)
@@ -222,7 +481,11 @@ def run_range_backtest(df: pd.DataFrame, coin: str, long_offset: float,
 def run_scalping_backtest(df: pd.DataFrame, coin: str, fast_ema: int,
                           slow_ema: int, rsi_period: int, rsi_oversold: int,
                           rsi_overbought: int, volume_multiplier: float,
-                          position_size: float) -> Optional[Dict]:
+                          position_size: float,
+                          fast_precomputed: Optional[np.ndarray] = None,
+                          slow_precomputed: Optional[np.ndarray] = None,
+                          rsi_precomputed: Optional[np.ndarray] = None,
+                          volume_spike_precomputed: Optional[np.ndarray] = None) -> Optional[BacktestResult]:
     """
     Run scalping strategy backtest
     
@@ -236,50 +499,55 @@ def run_scalping_backtest(df: pd.DataFrame, coin: str, fast_ema: int,
         rsi_overbought: RSI overbought threshold
         volume_multiplier: Volume spike multiplier
         position_size: Position size in USD
+        fast_precomputed: Optional fast EMA array (skips recomputation)
+        slow_precomputed: Optional slow EMA array (skips recomputation)
+        rsi_precomputed: Optional RSI array (skips recomputation)
+        volume_spike_precomputed: Optional volume spike mask (skips recomputation)
         
     Returns:
         Dictionary with backtest results or None
     """
     try:
-        df_copy = df.copy()
-        
-        df_copy['fast_ema'] = calculate_ema(df_copy['close'], fast_ema)
-        df_copy['slow_ema'] = calculate_ema(df_copy['close'], slow_ema)
-        df_copy['rsi'] = calculate_rsi(df_copy['close'], rsi_period)
-        df_copy['volume_spike'] = calculate_volume_spike(df_copy['volume'], volume_multiplier)
+        if (fast_precomputed is None and slow_precomputed is None
+                and rsi_precomputed is None and volume_spike_precomputed is None):
+            # Indicators, filters and trades in one pass
+            signals_generated, *totals = simulate_scalping_fused(
+                df['close'].to_numpy(dtype=np.float64), df['volume'].to_numpy(dtype=np.float64),
+                fast_ema, slow_ema, rsi_period, float(rsi_oversold), float(rsi_overbought),
+                float(volume_multiplier), float(position_size)
+            )
+            stats = statistics_from_totals(*totals)
+            if not stats:
+                return None
+            return {
+                'coin': coin,
+                'period': fast_ema,
+                'oversold': slow_ema,
+                'overbought': rsi_period,
+                'signals_generated': int(signals_generated),
+                **stats
+            }
+        
+        close = df['close'].to_numpy()
+        ts = df['timestamp'].to_numpy()
+        fast = (fast_precomputed if fast_precomputed is not None
+                else calculate_ema(df['close'], fast_ema).to_numpy())
+        slow = (slow_precomputed if slow_precomputed is not None
+                else calculate_ema(df['close'], slow_ema).to_numpy())
+        rsi = (rsi_precomputed if rsi_precomputed is not None
+               else calculate_rsi(df['close'], rsi_period).to_numpy())
+        volume_spike = (volume_spike_precomputed if volume_spike_precomputed is not None
+                        else calculate_volume_spike(df['volume'], volume_multiplier).to_numpy())
         
         # Generate signals
-        signals = []
-        for i in range(1, len(df_copy)):
-            if pd.isna(df_copy.iloc[i]['fast_ema']) or pd.isna(df_copy.iloc[i]['rsi']):
-                continue
-            
-            curr_fast = df_copy.iloc[i]['fast_ema']
-            curr_slow = df_copy.iloc[i]['slow_ema']
-            prev_fast = df_copy.iloc[i-1]['fast_ema']
-            prev_slow = df_copy.iloc[i-1]['slow_ema']
-            curr_rsi = df_copy.iloc[i]['rsi']
-            vol_spike = df_copy.iloc[i]['volume_spike']
-            
-            # Bullish crossover
-            if (prev_fast <= prev_slow and curr_fast > curr_slow and
-                curr_rsi > rsi_oversold and curr_rsi < rsi_overbought and vol_spike):
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': curr_rsi,
-                    'action': 'BUY'
-                })
-            
-            # Bearish crossover
-            elif (prev_fast >= prev_slow and curr_fast < curr_slow and
-                  curr_rsi < rsi_overbought and curr_rsi > rsi_oversold and vol_spike):
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': curr_rsi,
-                    'action': 'SELL'
-                })
+        buys, sells = _scalping_signals(fast, slow, rsi, volume_spike,
+                                        float(rsi_oversold), float(rsi_overbought),
+                                        _first_valid(fast, slow, rsi))
+        idx = np.concatenate((buys, sells))
+        is_buy = np.concatenate((np.ones(len(buys), dtype=bool), np.zeros(len(sells), dtype=bool)))
+        order = np.argsort(idx, kind='stable')
+        idx = idx[order]
+        signals = _build_signals(idx, is_buy[order], ts, close, rsi)
         
         # Simulate trades
         trades = simulate_trades(signals, position_size)
@@ -302,8 +570,54 @@ def run_scalping_backtest(df: pd.DataFrame, coin: str, fast_ema: int,
         return None
 
 
+def run_scalping_sweep(df: pd.DataFrame, coin: str, fast_emas: List[int],
+                       slow_emas: List[int], rsi_periods: List[int],
+                       rsi_oversold_levels: List[int], rsi_overbought_levels: List[int],
+                       volume_multipliers: List[float], position_size: float) -> List[BacktestResult]:
+    """
+    Run scalping backtests for every parameter combination
+    
+    EMAs, RSI and volume spike masks are computed once per distinct period or
+    multiplier; only the signal scan runs per combination.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        coin: Coin symbol
+        fast_emas: Fast EMA periods to test
+        slow_emas: Slow EMA periods to test
+        rsi_periods: RSI periods to test
+        rsi_oversold_levels: RSI oversold thresholds to test
+        rsi_overbought_levels: RSI overbought thresholds to test
+        volume_multipliers: Volume spike multipliers to test
+        position_size: Position size in USD
+        
+    Returns:
+        List of backtest result dictionaries (combinations without trades are skipped)
+    """
+    emas = {period: calculate_ema(df['close'], period).to_numpy()
+            for period in set(fast_emas) | set(slow_emas)}
+    rsis = {period: calculate_rsi(df['close'], period).to_numpy() for period in set(rsi_periods)}
+    spikes = {mult: calculate_volume_spike(df['volume'], mult).to_numpy()
+              for mult in set(volume_multipliers)}
+    
+    results = []
+    for fast_ema, slow_ema, rsi_period, rsi_oversold, rsi_overbought, volume_multiplier in itertools.product(
+            fast_emas, slow_emas, rsi_periods, rsi_oversold_levels,
+            rsi_overbought_levels, volume_multipliers):
+        result = run_scalping_backtest(
+            df, coin, fast_ema, slow_ema, rsi_period, rsi_oversold, rsi_overbought,
+            volume_multiplier, position_size,
+            fast_precomputed=emas[fast_ema], slow_precomputed=emas[slow_ema],
+            rsi_precomputed=rsis[rsi_period], volume_spike_precomputed=spikes[volume_multiplier]
+        )
+        if result:
+            results.append(result)
+    
+    return results
+
+
 def run_macd_backtest(df: pd.DataFrame, coin: str, fast: int,
-                      slow: int, signal_period: int, position_size: float) -> Optional[Dict]:
+                      slow: int, signal_period: int, position_size: float) -> Optional[BacktestResult]:
     """
     Run MACD strategy backtest
     
@@ -319,39 +633,11 @@ def run_macd_backtest(df: pd.DataFrame, coin: str, fast: int,
         Dictionary with backtest results or None
     """
     try:
-        df_copy = df.copy()
-        
-        macd_line, signal_line, histogram = calculate_macd(df_copy['close'], fast, slow, signal_period)
-        
-        # Generate signals
-        signals = []
-        for i in range(1, len(df_copy)):
-            if pd.isna(histogram.iloc[i]) or pd.isna(histogram.iloc[i-1]):
-                continue
-            
-            curr_hist = histogram.iloc[i]
-            prev_hist = histogram.iloc[i-1]
-            
-            # Bullish crossover
-            if prev_hist <= 0 and curr_hist > 0:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': 0,
-                    'action': 'BUY'
-                })
-            # Bearish crossover
-            elif prev_hist >= 0 and curr_hist < 0:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': df_copy.iloc[i]['close'],
-                    'rsi': 0,
-                    'action': 'SELL'
-                })
-        
-        # Simulate trades
-        trades = simulate_trades(signals, position_size)
-        stats = calculate_trade_statistics(trades)
+        # EMAs, histogram zero-line crossovers and trades in one pass
+        signals_generated, *totals = simulate_macd_fused(
+            df['close'].to_numpy(dtype=np.float64), fast, slow, signal_period, float(position_size)
+        )
+        stats = statistics_from_totals(*totals)
         
         if not stats:
             return None
@@ -361,7 +647,7 @@ def run_macd_backtest(df: pd.DataFrame, coin: str, fast: int,
             'period': fast,
             'oversold': slow,
             'overbought': signal_period,
-            'signals_generated': len(signals),
+            'signals_generated': int(signals_generated),
             **stats
         }
         
@@ -370,9 +656,52 @@ def run_macd_backtest(df: pd.DataFrame, coin: str, fast: int,
         return None
 
 
+def run_macd_sweep(df: pd.DataFrame, coin: str, fasts: List[int], slows: List[int],
+                   signal_periods: List[int], position_size: float) -> List[BacktestResult]:
+    """
+    Run MACD backtests for every (fast, slow, signal) combination
+    
+    The MACD line only depends on (fast, slow), so it is computed once per
+    pair and shared by all signal periods.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        coin: Coin symbol
+        fasts: Fast EMA periods to test
+        slows: Slow EMA periods to test
+        signal_periods: Signal line periods to test
+        position_size: Position size in USD
+        
+    Returns:
+        List of backtest result dictionaries (combinations without trades are skipped)
+    """
+    close = df['close'].to_numpy(dtype=np.float64)
+    
+    results = []
+    for fast in fasts:
+        for slow in slows:
+            macd_line = _macd_kernel(close, fast, slow, 1)[0]
+            for signal_period in signal_periods:
+                signals_generated, *totals = simulate_macd_signal(
+                    close, macd_line, signal_period, float(position_size)
+                )
+                stats = statistics_from_totals(*totals)
+                if stats:
+                    results.append({
+                        'coin': coin,
+                        'period': fast,
+                        'oversold': slow,
+                        'overbought': signal_period,
+                        'signals_generated': int(signals_generated),
+                        **stats
+                    })
+    
+    return results
+
+
 def run_bollinger_bands_backtest(df: pd.DataFrame, coin: str, period: int,
                                  std_dev: float, touch_threshold: float,
-                                 position_size: float) -> Optional[Dict]:
+                                 position_size: float) -> Optional[BacktestResult]:
     """
     Run Bollinger Bands strategy backtest
     
@@ -388,50 +717,35 @@ def run_bollinger_bands_backtest(df: pd.DataFrame, coin: str, period: int,
         Dictionary with backtest results or None
     """
     try:
-        df_copy = df.copy()
-        
+        close = df['close'].to_numpy()
+        ts = df['timestamp'].to_numpy()
         middle_band, upper_band, lower_band = calculate_bollinger_bands(
-            df_copy['close'], period, std_dev
+            df['close'], period, std_dev
         )
+        upper = upper_band.to_numpy()
+        lower = lower_band.to_numpy()
         
-        # Generate signals
-        signals = []
-        for i in range(len(df_copy)):
-            if pd.isna(upper_band.iloc[i]) or pd.isna(lower_band.iloc[i]):
-                continue
-            
-            current_price = df_copy.iloc[i]['close']
-            upper = upper_band.iloc[i]
-            lower = lower_band.iloc[i]
-            middle = middle_band.iloc[i]
-            
-            # Calculate BB position (0 to 1)
-            if upper != lower:
-                bb_position = (current_price - lower) / (upper - lower)
-            else:
-                bb_position = 0.5
-            
-            # Calculate distance to bands
-            distance_to_lower = abs(current_price - lower) / lower * 100
-            distance_to_upper = abs(upper - current_price) / upper * 100
-            
-            # BUY signal: Price near or below lower band
-            if bb_position <= 0.2 or distance_to_lower <= touch_threshold:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': current_price,
-                    'rsi': 0,
-                    'action': 'BUY'
-                })
-            
-            # SELL signal: Price near or above upper band
-            elif bb_position >= 0.8 or distance_to_upper <= touch_threshold:
-                signals.append({
-                    'timestamp': df_copy.iloc[i]['timestamp'],
-                    'price': current_price,
-                    'rsi': 0,
-                    'action': 'SELL'
-                })
+        # Skip the warm-up rows before the bands exist
+        start = _first_valid(upper, lower)
+        if start >= len(upper):
+            return None
+        upper = upper[start:]
+        lower = lower[start:]
+        price = close[start:]
+        
+        # BB position (0 at lower band, 1 at upper band) and distance to bands
+        width = upper - lower
+        bb_position = np.full_like(price, 0.5)
+        np.divide(price - lower, width, out=bb_position, where=width > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance_to_lower = np.abs(price - lower) / lower * 100
+            distance_to_upper = np.abs(upper - price) / upper * 100
+        
+        # BUY: price near or below lower band; SELL: near or above upper band
+        buy_mask = (bb_position <= 0.2) | (distance_to_lower <= touch_threshold)
+        sell_mask = (bb_position >= 0.8) | (distance_to_upper <= touch_threshold)
+        idx = np.flatnonzero(buy_mask | sell_mask)
+        signals = _build_signals(idx + start, buy_mask[idx], ts, close)
         
         # Simulate trades
         trades = simulate_trades(signals, position_size)
@@ -0,0 +1,24 @@
+"""
+Shared type definitions for backtesting
+"""
+from typing import TypedDict, Union
+
+
+class BacktestResult(TypedDict):
+    """
+    Result of one backtest parameter combination
+    
+    period / oversold / overbought hold the strategy's first three
+    parameters (e.g. short/long SMA period, range offset/tolerance).
+    """
+    coin: str
+    period: Union[int, float]
+    oversold: Union[int, float]
+    overbought: Union[int, float]
+    signals_generated: int
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    win_rate: float
+    total_profit_usd: float
+    avg_profit: float
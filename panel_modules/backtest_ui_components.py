@@ -1,90 +1,357 @@
 """
 UI components for backtest results display
+
+tkinter is imported inside the widget-building functions, so importing this
+module (e.g. for render_result_rows in a headless run) does not load Tk.
 """
-import tkinter as tk
-from typing import Dict, List
+import threading
+import numpy as np
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from .backtest_types import BacktestResult
+
+if TYPE_CHECKING:
+    from tkinter import ttk
+    import tkinter.font as tkfont
+
 
+# Named Font objects shared by every results widget, keyed by (family, size, weight)
+_FONT_CACHE = {}
 
-def create_result_row(parent, result: Dict, rank: int, colors: Dict) -> None:
+
+def _get_font(root, family: str, size: int, weight: str = 'normal') -> 'tkfont.Font':
     """
-    Create a result row in the UI
+    Return a cached Font so Tk resolves each font spec only once
     
     Args:
-        parent: Parent tkinter widget
-        result: Result dictionary
-        rank: Rank number
-        colors: Color scheme dictionary
+        root: Any widget of the Tk application
+        family: Font family
+        size: Point size
+        weight: 'normal' or 'bold'
+        
+    Returns:
+        Shared tkinter Font object
     """
-    row = tk.Frame(parent, bg=colors['bg_dark'] if rank % 2 == 0 else colors['bg_panel'])
-    row.pack(fill=tk.X, padx=10, pady=1)
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        import tkinter.font as tkfont
+        font = tkfont.Font(root=root, family=family, size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
+
+
+def _get_fonts(root) -> Dict[str, 'tkfont.Font']:
+    """
+    Return the fonts used by the results widgets
     
-    # Rank
-    rank_color = colors['green'] if rank <= 3 else colors['white']
-    tk.Label(row, text=f"#{rank}", bg=row['bg'], fg=rank_color,
-            font=('Courier', 8, 'bold'), width=4, anchor='w').pack(side=tk.LEFT, padx=2)
+    Args:
+        root: Any widget of the Tk application
+        
+    Returns:
+        Dictionary with 'small', 'small_bold', 'med_bold' and 'title' fonts
+    """
+    return {
+        'small': _get_font(root, 'Courier', 8),
+        'small_bold': _get_font(root, 'Courier', 8, 'bold'),
+        'med_bold': _get_font(root, 'Courier', 9, 'bold'),
+        'title': _get_font(root, 'Courier', 10, 'bold')
+    }
+
+
+# Reusable results widgets per parent: {str(parent): {name: widget}}
+_widget_cache = {}
+
+
+def _get_cached(parent, name: str):
+    """Return a cached widget for parent if it still exists, else None"""
+    widget = _widget_cache.get(str(parent), {}).get(name)
+    if widget is not None and widget.winfo_exists():
+        return widget
+    return None
+
+
+def _set_cached(parent, name: str, widget) -> None:
+    """Remember a reusable widget for parent"""
+    _widget_cache.setdefault(str(parent), {})[name] = widget
+
+
+def has_cached_results(parent) -> bool:
+    """
+    Check whether the results widgets for parent can be updated in place
     
-    # Coin
-    tk.Label(row, text=result['coin'], bg=row['bg'], fg=colors['white'],
-            font=('Courier', 8), width=6, anchor='w').pack(side=tk.LEFT, padx=2)
+    Args:
+        parent: Results container widget
+        
+    Returns:
+        True if the highlight and results table exist
+    """
+    return (_get_cached(parent, 'best_frame') is not None
+            and _get_cached(parent, 'table_frame') is not None)
+
+
+def invalidate(parent) -> None:
+    """
+    Destroy the cached results widgets of parent so the next call rebuilds them
     
-    # Period
-    tk.Label(row, text=str(result['period']), bg=row['bg'], fg=colors['white'],
-            font=('Courier', 8), width=7, anchor='w').pack(side=tk.LEFT, padx=2)
+    Use after a color scheme change or before clearing the container.
     
-    # Oversold
-    tk.Label(row, text=str(result['oversold']), bg=row['bg'], fg=colors['white'],
-            font=('Courier', 8), width=4, anchor='w').pack(side=tk.LEFT, padx=2)
+    Args:
+        parent: Results container widget
+    """
+    for name, widget in _widget_cache.pop(str(parent), {}).items():
+        if name.endswith('_frame'):
+            if widget.winfo_exists():
+                widget.destroy()
+
+
+# Geometry state of result containers hidden by begin_results_build
+_suspended_containers = {}
+
+
+def _find_canvas_window(parent):
+    """Return (canvas, item_id) when parent is embedded in a canvas window item"""
+    canvas = parent.master
+    for item in canvas.find_all():
+        if canvas.type(item) == 'window' and canvas.itemcget(item, 'window') == str(parent):
+            return canvas, item
+    return None
+
+
+def begin_results_build(parent) -> None:
+    """
+    Hide a results container while it is rebuilt
     
-    # Overbought
-    tk.Label(row, text=str(result['overbought']), bg=row['bg'], fg=colors['white'],
-            font=('Courier', 8), width=4, anchor='w').pack(side=tk.LEFT, padx=2)
+    The container is unmapped (pack_forget, or a hidden canvas window item)
+    so adding many child widgets does not relayout and repaint the window
+    after each one.
     
-    # Profit
-    profit_color = colors['green'] if result['total_profit_usd'] > 0 else colors['red']
-    profit_text = f"+${result['total_profit_usd']:.2f}" if result['total_profit_usd'] > 0 else f"${result['total_profit_usd']:.2f}"
-    tk.Label(row, text=profit_text, bg=row['bg'], fg=profit_color,
-            font=('Courier', 8, 'bold'), width=10, anchor='e').pack(side=tk.LEFT, padx=2)
+    Args:
+        parent: Container widget about to be filled
+    """
+    manager = parent.winfo_manager()
+    if manager == 'pack':
+        info = parent.pack_info()
+        info.pop('in', None)
+        _suspended_containers[str(parent)] = ('pack', info)
+        parent.pack_forget()
+    elif manager == 'canvas':
+        window = _find_canvas_window(parent)
+        if window:
+            canvas, item = window
+            canvas.itemconfigure(item, state='hidden')
+            _suspended_containers[str(parent)] = ('canvas', window)
+
+
+def end_results_build(parent) -> None:
+    """
+    Show a container hidden by begin_results_build and lay it out once
     
-    # Win rate
-    wr_color = colors['green'] if result['win_rate'] >= 50 else colors['red']
-    tk.Label(row, text=f"{result['win_rate']:.1f}%", bg=row['bg'], fg=wr_color,
-            font=('Courier', 8), width=7, anchor='e').pack(side=tk.LEFT, padx=2)
+    Args:
+        parent: Container widget that was filled
+    """
+    suspended = _suspended_containers.pop(str(parent), None)
+    if suspended:
+        manager, info = suspended
+        if manager == 'pack':
+            parent.pack(**info)
+        else:
+            canvas, item = info
+            canvas.itemconfigure(item, state='normal')
+    parent.update_idletasks()
+
+
+# Results table columns: (id, heading, width in characters, anchor)
+RESULT_COLUMNS = (
+    ('rank', "Rank", 5, 'w'),
+    ('coin', "Coin", 6, 'w'),
+    ('period', "Period", 7, 'w'),
+    ('os', "OS", 4, 'w'),
+    ('ob', "OB", 4, 'w'),
+    ('profit', "Profit", 10, 'e'),
+    ('winrate', "Win%", 7, 'e'),
+    ('trades', "Trades", 7, 'e')
+)
+MAX_VISIBLE_ROWS = 20  # Taller tables scroll inside the Treeview
+
+
+@dataclass
+class RenderedRow:
+    """Pre-formatted results table row (no Tk objects, safe to build off the Tk thread)"""
+    fields: Tuple[str, ...]
+    tags: Tuple[str, ...]  # Row tags ('even'/'odd', 'good'/'bad')
+
+
+def render_result_rows(results: List[BacktestResult]) -> List[RenderedRow]:
+    """
+    Format a ranked list of results for the results table in one pass
+    
+    The numeric columns and the row tags are formatted column-wise with NumPy;
+    Treeview tags color whole rows, so a row is 'good' or 'bad' by the sign
+    of its profit.
+    
+    Args:
+        results: Results in rank order (rank 1 first)
+        
+    Returns:
+        List of RenderedRow
+    """
+    if not results:
+        return []
     
-    # Trades
-    tk.Label(row, text=str(result['total_trades']), bg=row['bg'], fg=colors['white'],
-            font=('Courier', 8), width=7, anchor='e').pack(side=tk.LEFT, padx=2)
+    ranks = np.arange(1, len(results) + 1)
+    profits = np.array([r['total_profit_usd'] for r in results], dtype=np.float64)
+    win_rates = np.array([r['win_rate'] for r in results], dtype=np.float64)
+    
+    rank_strs = np.char.mod('#%d', ranks).tolist()
+    # '+$12.34' for gains, '$0.00' / '$-5.00' otherwise
+    profit_strs = np.char.add(np.where(profits > 0, '+$', '$'),
+                              np.char.mod('%.2f', profits)).tolist()
+    wr_strs = np.char.mod('%.1f%%', win_rates).tolist()
+    stripes = np.where(ranks % 2 == 0, 'even', 'odd').tolist()
+    profit_tags = np.where(profits > 0, 'good', 'bad').tolist()
+    
+    return [
+        RenderedRow(
+            fields=(rank_strs[i], r['coin'], str(r['period']), str(r['oversold']),
+                    str(r['overbought']), profit_strs[i], wr_strs[i], str(r['total_trades'])),
+            tags=(stripes[i], profit_tags[i])
+        )
+        for i, r in enumerate(results)
+    ]
+
+
+# Rows waiting to be inserted: {str(parent): {rank: RenderedRow}}
+_pending_results = {}
+_flush_scheduled = set()
+_pending_lock = threading.Lock()
+FLUSH_INTERVAL_MS = 50  # Apply queued rows at most ~20 times per second
+
+
+def _get_results_tree(parent) -> Optional['ttk.Treeview']:
+    """Return the Treeview of parent's results table, or None"""
+    table_frame = _get_cached(parent, 'table_frame')
+    return table_frame.tree if table_frame is not None else None
 
 
-def create_results_header(parent, colors: Dict) -> None:
+def _schedule_flush(parent) -> None:
+    """Schedule one _flush for parent unless one is already pending"""
+    key = str(parent)
+    with _pending_lock:
+        if key in _flush_scheduled or not _pending_results.get(key):
+            return
+        _flush_scheduled.add(key)
+    parent.after(FLUSH_INTERVAL_MS, lambda: _flush(parent))
+
+
+def enqueue_result(parent, row: RenderedRow, rank: int) -> None:
     """
-    Create results table header
+    Queue a row for the results table of parent
+    
+    Rows are applied in batches every FLUSH_INTERVAL_MS; a newer row for the
+    same rank replaces one that has not been shown yet. Rows queued before the
+    table exists are kept until create_results_header builds it.
+    
+    Args:
+        parent: Results container passed to create_results_header
+        row: Row from render_result_rows
+        rank: Rank number (one table row per rank)
+    """
+    with _pending_lock:
+        _pending_results.setdefault(str(parent), {})[rank] = row
+    _schedule_flush(parent)
+
+
+def _flush(parent) -> None:
+    """Insert or update all queued rows for parent in one batch"""
+    key = str(parent)
+    tree = _get_results_tree(parent)
+    with _pending_lock:
+        _flush_scheduled.discard(key)
+        if tree is None:
+            return
+        pending = _pending_results.pop(key, {})
+    
+    for rank, row in sorted(pending.items()):
+        iid = f"rank{rank}"
+        if tree.exists(iid):
+            tree.item(iid, values=row.fields, tags=row.tags)
+        else:
+            tree.insert('', 'end', iid=iid, values=row.fields, tags=row.tags)
+    set_visible_rows(tree, len(tree.get_children()))
+
+
+def create_results_header(parent, colors: Dict) -> 'ttk.Treeview':
+    """
+    Create the results table
     
     Args:
         parent: Parent tkinter widget
         colors: Color scheme dictionary
+        
+    Returns:
+        Treeview of the table (fill it with enqueue_result)
+    """
+    tree = _get_results_tree(parent)
+    if tree is not None:
+        tree.delete(*tree.get_children())
+        _schedule_flush(parent)
+        return tree
+    
+    import tkinter as tk
+    from tkinter import ttk
+    
+    fonts = _get_fonts(parent)
+    c_bg_dark = colors['bg_dark']
+    c_bg_panel = colors['bg_panel']
+    
+    style = ttk.Style(parent)
+    style.configure('Results.Treeview', background=c_bg_panel,
+                    fieldbackground=c_bg_panel, foreground=colors['white'],
+                    font=fonts['small'], borderwidth=0)
+    style.configure('Results.Treeview.Heading', background=c_bg_dark,
+                    foreground=colors['gray'], font=fonts['small_bold'])
+    
+    # The Treeview scrolls on its own, so Tk only draws the rows in view
+    table_frame = tk.Frame(parent, bg=c_bg_panel)
+    table_frame.pack(fill=tk.X, padx=10, pady=2)
+    
+    scrollbar = ttk.Scrollbar(table_frame, orient='vertical')
+    char_width = fonts['small_bold'].measure('0')
+    tree = ttk.Treeview(table_frame, columns=[col[0] for col in RESULT_COLUMNS], show='headings',
+                        style='Results.Treeview', height=0, selectmode='none',
+                        yscrollcommand=scrollbar.set)
+    for col_id, heading, width, anchor in RESULT_COLUMNS:
+        tree.heading(col_id, text=heading, anchor=anchor)
+        tree.column(col_id, width=width * char_width + 4, anchor=anchor, stretch=False)
+    
+    tree.tag_configure('even', background=c_bg_dark)
+    tree.tag_configure('odd', background=c_bg_panel)
+    tree.tag_configure('good', foreground=colors['green'])
+    tree.tag_configure('bad', foreground=colors['red'])
+    tree.pack(side=tk.LEFT, fill=tk.Y)
+    
+    scrollbar.configure(command=tree.yview)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    
+    table_frame.tree = tree
+    _set_cached(parent, 'table_frame', table_frame)
+    _schedule_flush(parent)
+    return tree
+
+
+def set_visible_rows(tree: 'ttk.Treeview', row_count: int) -> None:
+    """
+    Size the results table for row_count rows, capped at MAX_VISIBLE_ROWS
+    
+    Args:
+        tree: Treeview from create_results_header
+        row_count: Number of inserted rows
     """
-    header_row = tk.Frame(parent, bg=colors['bg_dark'])
-    header_row.pack(fill=tk.X, padx=10, pady=2)
-    
-    tk.Label(header_row, text="Rank", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=5, anchor='w').pack(side=tk.LEFT, padx=2)
-    tk.Label(header_row, text="Coin", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=6, anchor='w').pack(side=tk.LEFT, padx=2)
-    tk.Label(header_row, text="Period", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=7, anchor='w').pack(side=tk.LEFT, padx=2)
-    tk.Label(header_row, text="OS", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=4, anchor='w').pack(side=tk.LEFT, padx=2)
-    tk.Label(header_row, text="OB", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=4, anchor='w').pack(side=tk.LEFT, padx=2)
-    tk.Label(header_row, text="Profit", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=10, anchor='e').pack(side=tk.LEFT, padx=2)
-    tk.Label(header_row, text="Win%", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=7, anchor='e').pack(side=tk.LEFT, padx=2)
-    tk.Label(header_row, text="Trades", bg=colors['bg_dark'], fg=colors['gray'],
-            font=('Courier', 8, 'bold'), width=7, anchor='e').pack(side=tk.LEFT, padx=2)
-
-
-def create_best_overall_highlight(parent, best: Dict, colors: Dict) -> None:
+    tree.configure(height=min(row_count, MAX_VISIBLE_ROWS))
+
+
+def create_best_overall_highlight(parent, best: BacktestResult, colors: Dict) -> None:
     """
     Create best overall configuration highlight
     
@@ -93,21 +360,38 @@ def create_best_overall_highlight(parent, best: Dict, colors: Dict) -> None:
         best: Best result dictionary
         colors: Color scheme dictionary
     """
-    best_frame = tk.Frame(parent, bg=colors['green'], relief=tk.SOLID, borderwidth=2)
+    coin_text = f"{best['coin']} | Period: {best['period']} | Oversold: {best['oversold']} | Overbought: {best['overbought']}"
+    stats_text = f"Profit: ${best['total_profit_usd']:.2f} | Win Rate: {best['win_rate']:.1f}% | Trades: {best['total_trades']}"
+    
+    # Reuse the existing highlight - only the texts change between runs
+    if _get_cached(parent, 'best_frame') is not None:
+        _get_cached(parent, 'best_coin_lbl').configure(text=coin_text)
+        _get_cached(parent, 'best_stats_lbl').configure(text=stats_text)
+        return
+    
+    import tkinter as tk
+    
+    fonts = _get_fonts(parent)
+    c_green = colors['green']
+    c_bg_dark = colors['bg_dark']
+    
+    best_frame = tk.Frame(parent, bg=c_green, relief=tk.SOLID, borderwidth=2)
     best_frame.pack(fill=tk.X, padx=10, pady=10)
     
-    tk.Label(best_frame, text="🏆 BEST OVERALL CONFIGURATION", bg=colors['green'],
-            fg=colors['bg_dark'], font=('Courier', 10, 'bold')).pack(pady=5)
+    tk.Label(best_frame, text="🏆 BEST OVERALL CONFIGURATION", bg=c_green,
+            fg=c_bg_dark, font=fonts['title']).pack(pady=5)
     
-    best_info = tk.Frame(best_frame, bg=colors['bg_dark'])
+    best_info = tk.Frame(best_frame, bg=c_bg_dark)
     best_info.pack(fill=tk.X, padx=5, pady=5)
     
-    tk.Label(best_info, 
-            text=f"{best['coin']} | Period: {best['period']} | Oversold: {best['oversold']} | Overbought: {best['overbought']}",
-            bg=colors['bg_dark'], fg=colors['white'],
-            font=('Courier', 9, 'bold')).pack()
+    best_coin_lbl = tk.Label(best_info, text=coin_text, bg=c_bg_dark, fg=colors['white'],
+                             font=fonts['med_bold'])
+    best_coin_lbl.pack()
+    
+    best_stats_lbl = tk.Label(best_info, text=stats_text, bg=c_bg_dark, fg=c_green,
+                              font=fonts['med_bold'])
+    best_stats_lbl.pack()
     
-    tk.Label(best_info,
-            text=f"Profit: ${best['total_profit_usd']:.2f} | Win Rate: {best['win_rate']:.1f}% | Trades: {best['total_trades']}",
-            bg=colors['bg_dark'], fg=colors['green'],
-            font=('Courier', 9, 'bold')).pack()
+    _set_cached(parent, 'best_frame', best_frame)
+    _set_cached(parent, 'best_coin_lbl', best_coin_lbl)
+    _set_cached(parent, 'best_stats_lbl', best_stats_lbl)
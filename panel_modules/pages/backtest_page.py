@@ -5,23 +5,95 @@ Refactored for modularity - uses helper modules for cleaner code organization
 import tkinter as tk
 from tkinter import ttk
 import pandas as pd
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterator, List, Tuple
 import threading
 import itertools
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from config import TRADING_SETTINGS, BACKTEST_SETTINGS
 
+try:
+    import optuna
+    OPTUNA_AVAILABLE = True
+except ImportError:
+    OPTUNA_AVAILABLE = False
+
 # Import modular components
 from panel_modules.backtest_data_fetcher import fetch_historical_data
 from panel_modules.backtest_strategies import (
     run_rsi_backtest, run_sma_backtest, run_range_backtest,
-    run_scalping_backtest, run_macd_backtest
+    run_scalping_backtest, run_macd_backtest,
+    run_rsi_sweep, run_sma_sweep, run_scalping_sweep, run_macd_sweep, warmup_kernels
+)
+from panel_modules._njit import NUMBA_AVAILABLE
+from panel_modules.backtest_results import (
+    save_best_results, save_all_results, group_best_results_by_coin
 )
-from panel_modules.backtest_results import save_best_results, group_best_results_by_coin
 from panel_modules.backtest_ui_components import (
-    create_result_row, create_results_header, create_best_overall_highlight
+    create_results_header, create_best_overall_highlight,
+    begin_results_build, end_results_build, render_result_rows, enqueue_result, RenderedRow,
+    has_cached_results, invalidate
 )
 
 
+# Minimum time between progress updates posted to the Tk thread (seconds)
+STATUS_UPDATE_INTERVAL = 0.1
+
+# Coarse-to-fine search: number of coarse winners refined per coin
+REFINE_TOP_K = 5
+
+# Parameter search modes offered in the config panel
+SEARCH_MODES = ["exhaustive", "coarse_to_fine"] + (["bayesian"] if OPTUNA_AVAILABLE else [])
+
+# Bayesian search: concurrent trials per study
+BAYESIAN_JOBS = 4
+
+# Signal type -> BACKTEST_SETTINGS key holding its optimization ranges
+SIGNAL_CONFIG_KEYS = {
+    "RSI 1min": "rsi_1min_optimization",
+    "RSI 5min": "rsi_5min_optimization",
+    "RSI 1h": "rsi_1h_optimization",
+    "RSI 4h": "rsi_4h_optimization",
+    "SMA 5min": "sma_5min_optimization",
+    "Range 24h Low": "range_24h_low_optimization",
+    "Range 7days Low": "range_7days_low_optimization",
+    "Scalping 1min": "scalping_1min_optimization",
+    "MACD 15min": "macd_15min_optimization",
+    "Support/Resistance 1H": "support_resistance_1h_optimization"
+}
+
+# Signal type -> filename-friendly signal name used for saved results
+SIGNAL_FILENAMES = {
+    "RSI 1min": "rsi-1min",
+    "RSI 5min": "rsi-5min",
+    "RSI 1h": "rsi-1h",
+    "RSI 4h": "rsi-4h",
+    "SMA 5min": "sma-5min",
+    "Range 24h Low": "range-24h-low",
+    "Range 7days Low": "range-7days-low",
+    "Scalping 1min": "scalping-1min",
+    "MACD 15min": "macd-15min"
+}
+
+# Single-combination backtest per signal type (other signals are RSI variants)
+STRATEGY_BACKTESTS = {
+    "SMA 5min": run_sma_backtest,
+    "Range 24h Low": run_range_backtest,
+    "Range 7days Low": run_range_backtest,
+    "Scalping 1min": run_scalping_backtest,
+    "MACD 15min": run_macd_backtest
+}
+
+# Strategies with a sweep driver that shares indicators across the grid;
+# each takes the parameter lists in _param_lists order
+SWEEP_STRATEGIES = {
+    "SMA 5min": run_sma_sweep,
+    "Scalping 1min": run_scalping_sweep,
+    "MACD 15min": run_macd_sweep
+}
+
+
 class BacktestPage:
     """Self-optimizing backtest page for signal testing"""
     
@@ -49,13 +121,32 @@ class BacktestPage:
             "7 Days": 10080
         })
         
+        # Parameter search strategy (one of SEARCH_MODES)
+        self.search_mode = BACKTEST_SETTINGS.get('search_mode', 'exhaustive')
+        if self.search_mode not in SEARCH_MODES:
+            print(f"Search mode '{self.search_mode}' unavailable, using exhaustive search")
+            self.search_mode = 'exhaustive'
+        self.bayesian_trials = BACKTEST_SETTINGS.get('bayesian_trials', 100)
+        
         # Optimization ranges (will be loaded based on selected signal)
         self.optimization_ranges = {}
         self.current_interval = '1m'
+        self.min_data_length = 0
         
         # Coin selection state
         self.coin_vars = {}
         
+        # Compile the sweep kernels in the background so the first run doesn't pay for it
+        if NUMBA_AVAILABLE:
+            threading.Thread(target=warmup_kernels, daemon=True).start()
+        
+        # When the last progress update was posted (time.monotonic)
+        self._last_status_ts = 0.0
+        
+        # Results labels reused between optimization runs
+        self.results_title_label = None
+        self.results_section_label = None
+    
     def create_page(self):
         """Create the backtest page UI"""
         # Title
@@ -144,6 +235,18 @@ class BacktestPage:
                                          state='readonly', font=('Courier', 10))
         timerange_dropdown.pack(fill=tk.X, pady=5)
         
+        # Search mode selection
+        search_frame = tk.Frame(config_frame, bg=self.colors['bg_panel'])
+        search_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        tk.Label(search_frame, text="Search Mode:", bg=self.colors['bg_panel'],
+                fg=self.colors['white'], font=('Courier', 10)).pack(anchor='w')
+        
+        self.search_mode_var = tk.StringVar(value=self.search_mode)
+        search_dropdown = ttk.Combobox(search_frame, textvariable=self.search_mode_var,
+                                      values=SEARCH_MODES, state='readonly', font=('Courier', 10))
+        search_dropdown.pack(fill=tk.X, pady=5)
+        
         # Position size
         size_frame = tk.Frame(config_frame, bg=self.colors['bg_panel'])
         size_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -216,21 +319,7 @@ class BacktestPage:
         """Handle signal selection change"""
         signal = self.signal_var.get()
         
-        # Map signal names to config keys
-        signal_map = {
-            "RSI 1min": "rsi_1min_optimization",
-            "RSI 5min": "rsi_5min_optimization",
-            "RSI 1h": "rsi_1h_optimization",
-            "RSI 4h": "rsi_4h_optimization",
-            "SMA 5min": "sma_5min_optimization",
-            "Range 24h Low": "range_24h_low_optimization",
-            "Range 7days Low": "range_7days_low_optimization",
-            "Scalping 1min": "scalping_1min_optimization",
-            "MACD 15min": "macd_15min_optimization",
-            "Support/Resistance 1H": "support_resistance_1h_optimization"
-        }
-        
-        config_key = signal_map.get(signal, "rsi_1min_optimization")
+        config_key = SIGNAL_CONFIG_KEYS.get(signal, "rsi_1min_optimization")
         self.optimization_ranges = BACKTEST_SETTINGS.get(config_key, {
             'period': [10, 12, 14, 16, 18, 20],
             'oversold': [25, 28, 30, 32, 35],
@@ -238,8 +327,9 @@ class BacktestPage:
             'interval': '1m'
         })
         
-        # Update current interval
+        # Update current interval and the candles needed per coin
         self.current_interval = self.optimization_ranges.get('interval', '1m')
+        self.min_data_length = self._get_min_data_length(signal)
         
         # Update optimization info labels
         self._update_optimization_labels(signal)
@@ -365,25 +455,33 @@ class BacktestPage:
             minutes = self.time_ranges[timerange_name]
             position_size = float(self.position_size_var.get())
             signal_type = self.signal_var.get()
+            self.search_mode = self.search_mode_var.get()
             
-            # Generate combinations and run tests
-            all_results = self._run_all_tests(selected_coins, signal_type, minutes, position_size)
+            # Download all coins up front, then run tests without I/O in the loop
+            dfs = self._prefetch_data(selected_coins, minutes)
+            all_results = self._run_all_tests(selected_coins, dfs, signal_type, position_size)
             
-            # Sort by total profit
-            all_results.sort(key=lambda x: x['total_profit_usd'], reverse=True)
+            # Rank by total profit and keep each coin's best configuration
+            best_per_coin = group_best_results_by_coin(all_results)
             
             # Get signal name for saving
             signal_name = self._get_signal_filename(signal_type)
             
             # Save best results
-            save_best_results(all_results, signal_name, timerange_name, position_size)
+            save_best_results(best_per_coin, signal_name, timerange_name, position_size)
+            if BACKTEST_SETTINGS.get('fast_io', True):
+                save_all_results(all_results, signal_name)
+            
+            # Rows are formatted here; the Tk thread queues them once the table exists
+            rows = render_result_rows(best_per_coin)
             
             # Display results
             self.parent.after(0, lambda: self._display_optimization_results(
-                all_results, timerange_name, position_size))
+                best_per_coin, timerange_name, position_size, rows))
+            
             self.parent.after(0, lambda: self.status_label.config(
                 text=f"Optimization completed - Results saved to /results", fg=self.colors['green']))
-            
+                
         except Exception as e:
             error_msg = str(e)
             print(f"Optimization error: {error_msg}")
@@ -391,85 +489,252 @@ class BacktestPage:
             traceback.print_exc()
             self.parent.after(0, lambda msg=error_msg: self.status_label.config(
                 text=f"Error: {msg}", fg=self.colors['red']))
-        
+                
         finally:
             self.running_backtest = False
             self.parent.after(0, lambda: self.run_btn.config(state='normal', text="RUN OPTIMIZATION"))
     
-    def _run_all_tests(self, selected_coins: List[str], signal_type: str, 
-                       minutes: int, position_size: float) -> List[Dict]:
+    @staticmethod
+    def _coarse_indices(count: int) -> List[int]:
+        """Every other index of a parameter list, always including the last one"""
+        indices = list(range(0, count, 2))
+        if indices and indices[-1] != count - 1:
+            indices.append(count - 1)
+        return indices
+    
+    def _run_coarse_to_fine(self, df: pd.DataFrame, coin: str, signal_type: str,
+                            position_size: float) -> Tuple[List[Dict], int]:
+        """
+        Search the parameter grid in two phases instead of testing every combination
+        
+        Phase 1 tests every other value of each parameter. Phase 2 takes the
+        REFINE_TOP_K most profitable combinations and tests their direct
+        neighbours (one step up/down) along each parameter axis.
+        
+        Returns:
+            Tuple of (backtest results, number of combinations tested)
+        """
+        param_lists = self._param_lists(signal_type)
+        names = list(param_lists)
+        values = [param_lists[name] for name in names]
+        evaluated = {}
+        
+        def evaluate(index: tuple):
+            if index not in evaluated:
+                params = {name: vals[i] for name, vals, i in zip(names, values, index)}
+                evaluated[index] = self._run_strategy_backtest(df, coin, signal_type, params, position_size)
+        
+        # Phase 1: coarse grid
+        for index in itertools.product(*(self._coarse_indices(len(vals)) for vals in values)):
+            evaluate(index)
+        coarse_count = len(evaluated)
+        
+        # Phase 2: refine around the best coarse results
+        ranked = sorted((index for index, result in evaluated.items() if result),
+                        key=lambda index: evaluated[index]['total_profit_usd'], reverse=True)
+        for index in ranked[:REFINE_TOP_K]:
+            for dim, vals in enumerate(values):
+                for step in (-1, 1):
+                    i = index[dim] + step
+                    if 0 <= i < len(vals):
+                        evaluate(index[:dim] + (i,) + index[dim + 1:])
+        
+        print(f"{coin}: coarse search tested {coarse_count} combinations, "
+              f"refinement tested {len(evaluated) - coarse_count} more")
+        return [result for result in evaluated.values() if result], len(evaluated)
+    
+    def _run_bayesian_search(self, df: pd.DataFrame, coin: str, signal_type: str,
+                             position_size: float, n_trials: int = 100) -> Tuple[List[Dict], int]:
+        """
+        Search the parameter grid with Optuna's TPE sampler
+        
+        Each trial picks one value per parameter from the configured lists, so
+        results stay on the same grid as the exhaustive search.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            coin: Coin symbol
+            signal_type: Strategy to optimize
+            position_size: Position size in USD
+            n_trials: Number of trials (repeated combinations are not re-run)
+            
+        Returns:
+            Tuple of (backtest results, number of distinct combinations tested)
+        """
+        param_lists = self._param_lists(signal_type)
+        # Trials run on BAYESIAN_JOBS threads: the first trial to claim a
+        # combination runs it, the others wait on its Future
+        evaluated = {}
+        evaluated_lock = threading.Lock()
+        
+        def objective(trial) -> float:
+            params = {name: trial.suggest_categorical(name, values)
+                      for name, values in param_lists.items()}
+            key = tuple(params.values())
+            with evaluated_lock:
+                future = evaluated.get(key)
+                owner = future is None
+                if owner:
+                    future = evaluated[key] = Future()
+            if owner:
+                try:
+                    future.set_result(self._run_strategy_backtest(df, coin, signal_type, params, position_size))
+                except Exception as e:
+                    future.set_exception(e)
+            result = future.result()
+            return result['total_profit_usd'] if result else 0.0
+        
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        study = optuna.create_study(direction='maximize', sampler=optuna.samplers.TPESampler())
+        study.optimize(objective, n_trials=n_trials, n_jobs=BAYESIAN_JOBS)
+        
+        print(f"{coin}: bayesian search tested {len(evaluated)} combinations in {n_trials} trials")
+        results = [future.result() for future in evaluated.values() if not future.exception()]
+        return [result for result in results if result], len(evaluated)
+    
+    def _prefetch_data(self, selected_coins: List[str], minutes: int) -> Dict[str, Optional[pd.DataFrame]]:
+        """Fetch candles for all coins concurrently"""
+        dfs = {}
+        with ThreadPoolExecutor(max_workers=min(16, len(selected_coins))) as pool:
+            futures = {pool.submit(fetch_historical_data, coin, minutes, self.current_interval): coin
+                       for coin in selected_coins}
+            for future in as_completed(futures):
+                dfs[futures[future]] = future.result()
+                self.parent.after(0, lambda n=len(dfs), t=len(selected_coins): self.status_label.config(
+                    text=f"Fetched data for {n}/{t} coins..."))
+        return dfs
+    
+    def _run_all_tests(self, selected_coins: List[str], dfs: Dict[str, Optional[pd.DataFrame]],
+                       signal_type: str, position_size: float) -> List[Dict]:
         """Run all backtest combinations"""
         all_results = []
-        combinations = self._generate_combinations(signal_type)
-        total_tests = len(selected_coins) * len(combinations)
+        combination_count = math.prod(len(values) for values in self._param_lists(signal_type).values())
+        total_tests = len(selected_coins) * combination_count
         test_count = 0
+        searched_coins = 0
         
         for coin in selected_coins:
-            self.parent.after(0, lambda c=coin: self.status_label.config(
-                text=f"Fetching data for {c}..."))
+            df = dfs.get(coin)
+            if df is None or len(df) < self.min_data_length:
+                continue
             
-            df = fetch_historical_data(coin, minutes, self.current_interval)
+            # Non-exhaustive searches only backtest part of the grid
+            if self.search_mode != 'exhaustive':
+                if self.search_mode == 'bayesian':
+                    results, tested = self._run_bayesian_search(df, coin, signal_type, position_size,
+                                                                self.bayesian_trials)
+                else:
+                    results, tested = self._run_coarse_to_fine(df, coin, signal_type, position_size)
+                all_results.extend(results)
+                test_count += tested
+                searched_coins += 1
+                self._post_status(f"Searched {searched_coins}/{len(selected_coins)} coins, "
+                                  f"{test_count} configurations tested ({self.search_mode})...")
+                continue
             
-            if df is None or len(df) < self._get_min_data_length(signal_type):
+            # Strategies with a sweep driver share indicators across the whole grid
+            results = self._run_vectorized_tests(df, coin, signal_type, position_size)
+            if results is not None:
+                test_count += combination_count
+                self._post_status(f"Testing {test_count}/{total_tests} configurations...")
+                all_results.extend(results)
                 continue
             
             # Test all combinations for this coin
-            for combo in combinations:
+            for params in self._generate_combinations(signal_type):
                 test_count += 1
-                self.parent.after(0, lambda tc=test_count, tt=total_tests: self.status_label.config(
-                    text=f"Testing {tc}/{tt} configurations..."))
+                self._post_status(f"Testing {test_count}/{total_tests} configurations...")
                 
-                result = self._run_strategy_backtest(df, coin, signal_type, combo, position_size)
+                result = self._run_strategy_backtest(df, coin, signal_type, params, position_size)
                 if result:
                     all_results.append(result)
         
         return all_results
     
-    def _generate_combinations(self, signal_type: str) -> List:
-        """Generate parameter combinations based on signal type"""
+    def _post_status(self, text: str) -> None:
+        """
+        Show progress text from the worker thread, at most once per STATUS_UPDATE_INTERVAL
+        
+        Args:
+            text: Status label text
+        """
+        now = time.monotonic()
+        if now - self._last_status_ts > STATUS_UPDATE_INTERVAL:
+            self._last_status_ts = now
+            self.parent.after(0, lambda: self.status_label.config(text=text))
+    
+    def _run_vectorized_tests(self, df: pd.DataFrame, coin: str, signal_type: str,
+                              position_size: float) -> Optional[List[Dict]]:
+        """
+        Run the full parameter grid for one coin with a sweep driver
+        
+        Returns None for strategies without a sweep driver (Range),
+        which fall back to the per-combination loop.
+        """
+        if signal_type.startswith("RSI"):
+            sweep = run_rsi_sweep
+        else:
+            sweep = SWEEP_STRATEGIES.get(signal_type)
+        if sweep is None:
+            return None
+        
+        return sweep(df, coin, *self._param_lists(signal_type).values(), position_size)
+    
+    def _param_lists(self, signal_type: str) -> Dict[str, List]:
+        """Get the values to test per parameter, keyed by the strategy's parameter names"""
+        ranges = self.optimization_ranges
         if signal_type == "SMA 5min":
-            short = self.optimization_ranges.get('short_period', [5, 8, 10, 12, 15])
-            long = self.optimization_ranges.get('long_period', [20, 25, 30, 35, 40])
-            return list(itertools.product(short, long))
+            params = {
+                'short_period': ranges.get('short_period', [5, 8, 10, 12, 15]),
+                'long_period': ranges.get('long_period', [20, 25, 30, 35, 40])
+            }
         elif signal_type in ["Range 24h Low", "Range 7days Low"]:
-            offsets = self.optimization_ranges.get('long_offset', [-2.0, -1.5, -1.0, -0.5, 0.0])
-            tolerances = self.optimization_ranges.get('tolerance', [1.0, 1.5, 2.0, 2.5, 3.0])
-            return list(itertools.product(offsets, tolerances))
+            params = {
+                'long_offset': ranges.get('long_offset', [-2.0, -1.5, -1.0, -0.5, 0.0]),
+                'tolerance': ranges.get('tolerance', [1.0, 1.5, 2.0, 2.5, 3.0])
+            }
         elif signal_type == "Scalping 1min":
-            fast = self.optimization_ranges.get('fast_ema', [3, 5, 8])
-            slow = self.optimization_ranges.get('slow_ema', [10, 13, 15, 20])
-            rsi_p = self.optimization_ranges.get('rsi_period', [5, 7, 9])
-            rsi_os = self.optimization_ranges.get('rsi_oversold', [25, 30, 35])
-            rsi_ob = self.optimization_ranges.get('rsi_overbought', [65, 70, 75])
-            vol = self.optimization_ranges.get('volume_multiplier', [1.3, 1.5, 1.8, 2.0])
-            return list(itertools.product(fast, slow, rsi_p, rsi_os, rsi_ob, vol))
+            params = {
+                'fast_ema': ranges.get('fast_ema', [3, 5, 8]),
+                'slow_ema': ranges.get('slow_ema', [10, 13, 15, 20]),
+                'rsi_period': ranges.get('rsi_period', [5, 7, 9]),
+                'rsi_oversold': ranges.get('rsi_oversold', [25, 30, 35]),
+                'rsi_overbought': ranges.get('rsi_overbought', [65, 70, 75]),
+                'volume_multiplier': ranges.get('volume_multiplier', [1.3, 1.5, 1.8, 2.0])
+            }
         elif signal_type == "MACD 15min":
-            fast = self.optimization_ranges.get('fast', [8, 10, 12, 14, 16])
-            slow = self.optimization_ranges.get('slow', [20, 23, 26, 29, 32])
-            signal = self.optimization_ranges.get('signal', [7, 8, 9, 10, 11])
-            return list(itertools.product(fast, slow, signal))
+            params = {
+                'fast': ranges.get('fast', [8, 10, 12, 14, 16]),
+                'slow': ranges.get('slow', [20, 23, 26, 29, 32]),
+                'signal_period': ranges.get('signal', [7, 8, 9, 10, 11])
+            }
         else:
             # RSI signals
-            periods = self.optimization_ranges.get('period', [10, 12, 14, 16, 18, 20])
-            oversold = self.optimization_ranges.get('oversold', [25, 28, 30, 32, 35])
-            overbought = self.optimization_ranges.get('overbought', [65, 68, 70, 72, 75])
-            return list(itertools.product(periods, oversold, overbought))
+            params = {
+                'period': ranges.get('period', [10, 12, 14, 16, 18, 20]),
+                'oversold': ranges.get('oversold', [25, 28, 30, 32, 35]),
+                'overbought': ranges.get('overbought', [65, 68, 70, 72, 75])
+            }
+        
+        return params
+    
+    def _generate_combinations(self, signal_type: str) -> Iterator[Dict]:
+        """
+        Generate parameter combinations based on signal type
+        
+        Yields:
+            One keyword-argument dict per combination, built on demand
+        """
+        params = self._param_lists(signal_type)
+        names = list(params)
+        for values in itertools.product(*params.values()):
+            yield dict(zip(names, values))
     
     def _run_strategy_backtest(self, df: pd.DataFrame, coin: str, signal_type: str,
-                               combo: tuple, position_size: float) -> Optional[Dict]:
+                               params: Dict, position_size: float) -> Optional[Dict]:
         """Run backtest for specific strategy and parameters"""
-        if signal_type == "SMA 5min":
-            return run_sma_backtest(df, coin, combo[0], combo[1], position_size)
-        elif signal_type in ["Range 24h Low", "Range 7days Low"]:
-            return run_range_backtest(df, coin, combo[0], combo[1], position_size)
-        elif signal_type == "Scalping 1min":
-            return run_scalping_backtest(df, coin, combo[0], combo[1], combo[2], 
-                                        combo[3], combo[4], combo[5], position_size)
-        elif signal_type == "MACD 15min":
-            return run_macd_backtest(df, coin, combo[0], combo[1], combo[2], position_size)
-        else:
-            # RSI signals
-            return run_rsi_backtest(df, coin, combo[0], combo[1], combo[2], position_size)
+        backtest = STRATEGY_BACKTESTS.get(signal_type, run_rsi_backtest)
+        return backtest(df, coin, **params, position_size=position_size)
     
     def _get_min_data_length(self, signal_type: str) -> int:
         """Get minimum data length required for signal type"""
@@ -482,52 +747,61 @@ class BacktestPage:
     
     def _get_signal_filename(self, signal_type: str) -> str:
         """Get filename-friendly signal name"""
-        signal_map = {
-            "RSI 1min": "rsi-1min",
-            "RSI 5min": "rsi-5min",
-            "RSI 1h": "rsi-1h",
-            "RSI 4h": "rsi-4h",
-            "SMA 5min": "sma-5min",
-            "Range 24h Low": "range-24h-low",
-            "Range 7days Low": "range-7days-low",
-            "Scalping 1min": "scalping-1min",
-            "MACD 15min": "macd-15min"
-        }
-        return signal_map.get(signal_type, "rsi-1min")
+        return SIGNAL_FILENAMES.get(signal_type, "rsi-1min")
     
-    def _display_optimization_results(self, results: List[Dict], timerange: str, position_size: float):
+    def _display_optimization_results(self, best_per_coin: List[Dict], timerange: str,
+                                      position_size: float, rows: List[RenderedRow]):
         """Display optimization results"""
-        # Clear previous results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-        
-        if not results:
-            tk.Label(self.results_frame, text="No profitable configurations found",
-                    bg=self.colors['bg_panel'], fg=self.colors['red'],
-                    font=('Courier', 10)).pack(pady=50)
-            return
-        
-        # Get best results per coin
-        best_per_coin = group_best_results_by_coin(results)
-        
-        # Header
-        header = tk.Frame(self.results_frame, bg=self.colors['bg_dark'])
-        header.pack(fill=tk.X, padx=10, pady=10)
+        begin_results_build(self.results_frame)
+        try:
+            self._build_optimization_results(best_per_coin, timerange, position_size)
+        finally:
+            end_results_build(self.results_frame)
         
-        tk.Label(header, text=f"Optimization Results - {timerange} - ${position_size} per trade",
-                bg=self.colors['bg_dark'], fg=self.colors['white'],
-                font=('Courier', 11, 'bold')).pack()
+        # Inserted into the table in batches
+        for i, row in enumerate(rows):
+            enqueue_result(self.results_frame, row, i + 1)
+    
+    def _build_optimization_results(self, best_per_coin: List[Dict], timerange: str,
+                                    position_size: float):
+        """Fill the results frame with optimization results"""
+        title_text = f"Optimization Results - {timerange} - ${position_size} per trade"
+        section_text = f"═══ BEST CONFIGURATION PER COIN ({len(best_per_coin)} coins) ═══"
+        
+        if best_per_coin and has_cached_results(self.results_frame):
+            # Same layout as the previous run - update texts and rows in place
+            self.results_title_label.configure(text=title_text)
+            self.results_section_label.configure(text=section_text)
+        else:
+            # Clear previous results
+            invalidate(self.results_frame)
+            for widget in self.results_frame.winfo_children():
+                widget.destroy()
+            
+            if not best_per_coin:
+                tk.Label(self.results_frame, text="No profitable configurations found",
+                        bg=self.colors['bg_panel'], fg=self.colors['red'],
+                        font=('Courier', 10)).pack(pady=50)
+                return
+            
+            # Header
+            header = tk.Frame(self.results_frame, bg=self.colors['bg_dark'])
+            header.pack(fill=tk.X, padx=10, pady=10)
+            
+            self.results_title_label = tk.Label(header, text=title_text,
+                    bg=self.colors['bg_dark'], fg=self.colors['white'],
+                    font=('Courier', 11, 'bold'))
+            self.results_title_label.pack()
         
         # Best overall highlight
         create_best_overall_highlight(self.results_frame, best_per_coin[0], self.colors)
         
-        # Best per coin section
-        tk.Label(self.results_frame, text=f"═══ BEST CONFIGURATION PER COIN ({len(best_per_coin)} coins) ═══",
-                bg=self.colors['bg_panel'], fg=self.colors['white'],
-                font=('Courier', 10, 'bold')).pack(pady=(20, 10))
+        if self.results_section_label is None or not self.results_section_label.winfo_exists():
+            # Best per coin section
+            self.results_section_label = tk.Label(self.results_frame, text=section_text,
+                    bg=self.colors['bg_panel'], fg=self.colors['white'],
+                    font=('Courier', 10, 'bold'))
+            self.results_section_label.pack(pady=(20, 10))
         
-        # Results table
+        # Results table (rows arrive through enqueue_result)
         create_results_header(self.results_frame, self.colors)
-        
-        for i, result in enumerate(best_per_coin):
-            create_result_row(self.results_frame, result, i + 1, self.colors)
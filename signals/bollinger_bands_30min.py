@@ -5,17 +5,34 @@ Generates BUY signals when price touches lower band and SELL signals when price
 """
 
 import time
-import requests
-import pandas as pd
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from core.signal import Signal
 from utils.logger import get_logger
+from utils.binance_http import SESSION, KLINES_URL, parse_klines
 from utils.backtest_results_loader import get_backtest_loader
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Recently fetched candles: (coin, interval, limit) -> (fetch time, OHLCV arrays)
+_CANDLE_CACHE = {}
+CANDLE_CACHE_TTL = 60  # Seconds a fetched 30-minute candle set is reused
+
+# Threads used by generate_signals_batch to overlap candle requests
+BATCH_MAX_WORKERS = 8
+RATE_LIMIT_BURST = BATCH_MAX_WORKERS  # Requests that may go out at once before spacing applies
+
 
 class BollingerBands30MinSignalGenerator:
     """
@@ -44,8 +61,13 @@ class BollingerBands30MinSignalGenerator:
         self.touch_threshold = touch_threshold
         
         self.name = "bollinger_bands_30min"
-        self.last_request_time = 0
-        self.min_request_interval = 0.5  # 500ms between requests to avoid rate limit
+        self.min_request_interval = 0.5  # 500ms between requests (on average) to avoid rate limit
+        self._rate_lock = threading.Lock()  # Request budget is shared across batch threads
+        self._rate_tokens = RATE_LIMIT_BURST
+        self._rate_updated = time.time()
+        
+        # Live band state per coin: rolling window of closes (forming candle last) and its sums
+        self._bb_state = {}
         
         # Get backtest loader
         self.backtest_loader = get_backtest_loader()
@@ -53,13 +75,23 @@ class BollingerBands30MinSignalGenerator:
         logger.info(f"Initialized {self.name} (default: period={period}, std_dev={std_dev}, threshold={touch_threshold}%)")
     
     def _rate_limit(self):
-        """Ensure we don't exceed Binance free API rate limits."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        """
+        Ensure we don't exceed Binance free API rate limits.
+        
+        Token bucket: up to RATE_LIMIT_BURST requests may run concurrently, and
+        the budget refills at one request per min_request_interval.
+        """
+        # Take a token under the lock (going into debt reserves a future slot), sleep outside it
+        with self._rate_lock:
+            now = time.time()
+            refill = (now - self._rate_updated) / self.min_request_interval
+            self._rate_tokens = min(RATE_LIMIT_BURST, self._rate_tokens + refill) - 1
+            self._rate_updated = now
+            wait = -self._rate_tokens * self.min_request_interval
+        if wait > 0:
+            time.sleep(wait)
     
-    def _fetch_candles(self, coin: str, limit: int = 100) -> Optional[pd.DataFrame]:
+    def _fetch_candles(self, coin: str, limit: int = 100) -> Optional[Dict[str, np.ndarray]]:
         """
         Fetch 30-minute candles from Binance free API.
         
@@ -68,69 +100,36 @@ class BollingerBands30MinSignalGenerator:
             limit: Number of candles to fetch
             
         Returns:
-            DataFrame with OHLCV data or None if failed
+            Dict of OHLCV arrays or None if failed
         """
+        key = (coin, '30m', limit)
+        cached = _CANDLE_CACHE.get(key)
+        if cached is not None and time.time() - cached[0] < CANDLE_CACHE_TTL:
+            return cached[1]
+        
         try:
             self._rate_limit()
             
             symbol = f"{coin}USDT"
-            url = "https://api.binance.com/api/v3/klines"
             params = {
                 'symbol': symbol,
                 'interval': '30m',
                 'limit': limit
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = SESSION.get(KLINES_URL, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            # Convert to numeric
-            df['close'] = pd.to_numeric(df['close'])
-            df['high'] = pd.to_numeric(df['high'])
-            df['low'] = pd.to_numeric(df['low'])
-            df['volume'] = pd.to_numeric(df['volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            candles = parse_klines(data)
+            _CANDLE_CACHE[key] = (time.time(), candles)
+            return candles
             
         except Exception as e:
             logger.error(f"Failed to fetch candles for {coin}: {e}")
             return None
     
-    def _calculate_bollinger_bands(self, prices: pd.Series) -> tuple:
-        """
-        Calculate Bollinger Bands.
-        
-        Args:
-            prices: Series of closing prices
-            
-        Returns:
-            Tuple of (middle_band, upper_band, lower_band, bandwidth)
-        """
-        # Calculate middle band (SMA)
-        middle_band = prices.rolling(window=self.period).mean()
-        
-        # Calculate standard deviation
-        std = prices.rolling(window=self.period).std()
-        
-        # Calculate upper and lower bands
-        upper_band = middle_band + (std * self.std_dev)
-        lower_band = middle_band - (std * self.std_dev)
-        
-        # Calculate bandwidth (volatility measure)
-        bandwidth = ((upper_band - lower_band) / middle_band) * 100
-        
-        return middle_band, upper_band, lower_band, bandwidth
-    
     def _calculate_bb_position(self, price: float, upper: float, lower: float, middle: float) -> float:
         """
         Calculate price position within Bollinger Bands (0 to 1).
@@ -150,8 +149,8 @@ class BollingerBands30MinSignalGenerator:
         position = (price - lower) / (upper - lower)
         return max(0.0, min(1.0, position))
     
-    def _calculate_signal_strength(self, bb_position: float, bandwidth: float, 
-                                  action: str, price: float, lower: float, upper: float) -> float:
+    def _calculate_signal_strength(self, bb_position: float, bandwidth: float,
+                                  action: str, distance_to_band: float) -> float:
         """
         Calculate signal strength based on BB position and bandwidth.
         
@@ -159,57 +158,34 @@ class BollingerBands30MinSignalGenerator:
             bb_position: Price position within bands (0 to 1)
             bandwidth: Bollinger Bands width percentage
             action: "BUY" or "SELL"
-            price: Current price
-            lower: Lower band value
-            upper: Upper band value
-            
+            distance_to_band: Distance (%) from price to the band being acted on
+                              (lower band for BUY, upper band for SELL)
+                              
         Returns:
             Signal strength from 0.0 to 1.0
         """
+        # Base strength from position: strongest at the lower band for BUY,
+        # at the upper band for SELL
         if action == "BUY":
-            # Stronger signal when price is closer to lower band
-            # Also consider bandwidth (higher volatility = stronger signal)
-            distance_to_lower = abs(price - lower) / lower * 100
-            
-            # Base strength from position (0.0 = at lower band = strongest)
             position_strength = 1.0 - bb_position
-            
-            # Adjust for distance to band
-            if distance_to_lower <= self.touch_threshold:
-                # Very close to band
-                strength = 0.85 + (position_strength * 0.15)
-            else:
-                # Further from band
-                strength = 0.6 + (position_strength * 0.2)
-            
-            # Boost for high volatility (wider bands)
-            if bandwidth > 4.0:  # High volatility
-                strength = min(1.0, strength + 0.1)
-            
-            return min(1.0, max(0.0, strength))
-        
         elif action == "SELL":
-            # Stronger signal when price is closer to upper band
-            distance_to_upper = abs(upper - price) / upper * 100
-            
-            # Base strength from position (1.0 = at upper band = strongest)
             position_strength = bb_position
-            
-            # Adjust for distance to band
-            if distance_to_upper <= self.touch_threshold:
-                # Very close to band
-                strength = 0.85 + (position_strength * 0.15)
-            else:
-                # Further from band
-                strength = 0.6 + (position_strength * 0.2)
-            
-            # Boost for high volatility (wider bands)
-            if bandwidth > 4.0:  # High volatility
-                strength = min(1.0, strength + 0.1)
-            
-            return min(1.0, max(0.0, strength))
+        else:
+            return 0.0
+        
+        # Adjust for distance to band
+        if distance_to_band <= self.touch_threshold:
+            # Very close to band
+            strength = 0.85 + (position_strength * 0.15)
+        else:
+            # Further from band
+            strength = 0.6 + (position_strength * 0.2)
+        
+        # Boost for high volatility (wider bands)
+        if bandwidth > 4.0:
+            strength = min(1.0, strength + 0.1)
         
-        return 0.0
+        return min(1.0, max(0.0, strength))
     
     def _load_coin_parameters(self, coin: str):
         """
@@ -249,74 +225,264 @@ class BollingerBands30MinSignalGenerator:
             # Load coin-specific parameters
             self._load_coin_parameters(coin)
             
-            # Fetch candles (need enough for BB calculation)
-            df = self._fetch_candles(coin, limit=self.period + 50)
-            if df is None or len(df) < self.period:
-                logger.warning(f"{self.name}: Insufficient data for {coin}")
-                return None
-            
-            # Calculate Bollinger Bands
-            middle_band, upper_band, lower_band, bandwidth = self._calculate_bollinger_bands(df['close'])
-            
-            # Get current values
-            current_price = df['close'].iloc[-1]
-            current_middle = middle_band.iloc[-1]
-            current_upper = upper_band.iloc[-1]
-            current_lower = lower_band.iloc[-1]
-            current_bandwidth = bandwidth.iloc[-1]
+            # Update the rolling band state from the latest candles
+            limit = self._candle_limit(coin)
+            window = self._update_bb_state(coin, self._fetch_candles(coin, limit=limit))
+            if window is None and limit == 2:
+                # The latest candles don't continue the window - reseed from a full fetch
+                window = self._update_bb_state(coin, self._fetch_candles(coin, limit=self._candle_limit(coin)))
             
-            # Check for NaN values
-            if pd.isna(current_middle) or pd.isna(current_upper) or pd.isna(current_lower):
-                logger.warning(f"{self.name}: Invalid BB values for {coin}")
-                return None
+            return self._signal_from_window(coin, window)
             
-            # Calculate BB position
-            bb_position = self._calculate_bb_position(
-                current_price, current_upper, current_lower, current_middle
-            )
-            
-            # Determine action based on band proximity
-            action = "HOLD"
-            distance_to_lower = abs(current_price - current_lower) / current_lower * 100
-            distance_to_upper = abs(current_upper - current_price) / current_upper * 100
-            
-            # BUY signal: Price near or below lower band
-            if bb_position <= 0.2 or distance_to_lower <= self.touch_threshold:
-                action = "BUY"
+        except Exception as e:
+            logger.error(f"{self.name}: Error generating signal for {coin}: {e}")
+            return None
+    
+    def generate_signals_batch(self, coins: List[str]) -> List[Optional[Signal]]:
+        """
+        Generate trading signals for several coins, fetching their candles concurrently.
+        
+        Args:
+            coins: Coin symbols (e.g., ["BTC", "ETH"])
             
-            # SELL signal: Price near or above upper band
-            elif bb_position >= 0.8 or distance_to_upper <= self.touch_threshold:
-                action = "SELL"
+        Returns:
+            Signal (or None) for each coin, in the same order as coins
+        """
+        # Candle limits depend on each coin's parameters and rolling state
+        limits = []
+        for coin in coins:
+            self._load_coin_parameters(coin)
+            limits.append(self._candle_limit(coin))
+        
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as pool:
+            fetched = list(pool.map(self._fetch_candles, coins, limits))
+            
+            # Band state is updated serially since parameters are stored on the instance
+            windows = []
+            for coin, limit, candles in zip(coins, limits, fetched):
+                windows.append(self._try_update_bb_state(coin, candles))
+            
+            # Coins whose latest candles don't continue the window reseed from a full fetch
+            reseed = [i for i, limit in enumerate(limits) if limit == 2 and windows[i] is None]
+            if reseed:
+                reseed_limits = []
+                for i in reseed:
+                    self._load_coin_parameters(coins[i])
+                    reseed_limits.append(self._candle_limit(coins[i]))
+                refetched = pool.map(self._fetch_candles, [coins[i] for i in reseed], reseed_limits)
+                for i, candles in zip(reseed, refetched):
+                    windows[i] = self._try_update_bb_state(coins[i], candles)
+        
+        signals = []
+        for coin, window in zip(coins, windows):
+            try:
+                self._load_coin_parameters(coin)
+                signals.append(self._signal_from_window(coin, window))
+            except Exception as e:
+                logger.error(f"{self.name}: Error generating signal for {coin}: {e}")
+                signals.append(None)
+        
+        return signals
+    
+    def _candle_limit(self, coin: str) -> int:
+        """Number of candles to fetch for coin: the last two once its rolling window is seeded."""
+        state = self._bb_state.get(coin)
+        if state is not None and state['period'] == self.period:
+            return 2
+        return self.period + 50
+    
+    def _try_update_bb_state(self, coin: str, candles: Optional[Dict[str, np.ndarray]]) -> Optional[tuple]:
+        """
+        Load coin's parameters and run _update_bb_state, so one bad coin doesn't fail a batch.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            candles: Dict of OHLCV arrays (or None if the fetch failed)
             
-            # Calculate signal strength
-            strength = self._calculate_signal_strength(
-                bb_position, current_bandwidth, action, 
-                current_price, current_lower, current_upper
-            )
+        Returns:
+            Result of _update_bb_state, or None if it raised (the coin's window is dropped)
+        """
+        try:
+            self._load_coin_parameters(coin)
+            return self._update_bb_state(coin, candles)
+        except Exception as e:
+            logger.error(f"{self.name}: Error updating Bollinger state for {coin}: {e}")
+            self._bb_state.pop(coin, None)
+            return None
+    
+    def _update_bb_state(self, coin: str, candles: Optional[Dict[str, np.ndarray]]) -> Optional[tuple]:
+        """
+        Advance the coin's rolling Bollinger window and return the latest band inputs.
+        
+        With a seeded window only the last two candles are needed: the forming candle's
+        close is replaced in place, and a newly opened candle drops the oldest close.
+        Running sums of the closes (shifted by the seed price) give the mean/std in O(1).
+        A full fetch (see _candle_limit) seeds the window.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            candles: Dict of OHLCV arrays (or None if the fetch failed)
             
-            # Create signal
-            signal = Signal(
-                coin=coin,
-                action=action,
-                strength=strength,
-                timestamp=datetime.now(),
-                source=self.name,
-                metadata={
-                    'current_price': round(current_price, 6),
-                    'upper_band': round(current_upper, 6),
-                    'middle_band': round(current_middle, 6),
-                    'lower_band': round(current_lower, 6),
-                    'bb_position': round(bb_position, 3),
-                    'bandwidth': round(current_bandwidth, 2),
-                    'period': self.period,
-                    'std_dev': self.std_dev,
-                    'timeframe': '30m'
-                }
-            )
+        Returns:
+            Tuple of (current_price, middle_band, std), or None if the candles are
+            insufficient or don't continue the window (which is then dropped)
+        """
+        n = 0 if candles is None else len(candles['close'])
+        state = self._bb_state.get(coin)
+        if state is not None and state['period'] == self.period and n == 2:
+            timestamps = candles['timestamp']
+            closes = candles['close']
+            
+            if timestamps[1] == state['last_ts']:
+                self._replace_last_close(state, closes[1])
+                return self._bb_state_bands(state, closes[1])
+            
+            if timestamps[0] == state['last_ts']:
+                # The forming candle closed and a new one opened
+                self._replace_last_close(state, closes[0])
+                self._push_close(state, closes[1])
+                state['last_ts'] = timestamps[1]
+                return self._bb_state_bands(state, closes[1])
+        
+        if n < self.period:
+            self._bb_state.pop(coin, None)
+            return None
+        
+        # Seed (or reseed after a gap / parameter change) from a full window
+        tail = candles['close'][-self.period:]
+        shift = tail[0]
+        shifted = tail - shift
+        self._bb_state[coin] = {
+            'period': self.period,
+            'shift': shift,
+            'window': deque(shifted, maxlen=self.period),
+            'sum': float(shifted.sum()),
+            'sum_sq': float((shifted * shifted).sum()),
+            'last_ts': candles['timestamp'][-1]
+        }
+        
+        std = tail.std(ddof=1) if self.period > 1 else np.nan
+        return tail[-1], tail.mean(), std
+    
+    @staticmethod
+    def _replace_last_close(state: dict, close: float):
+        """Replace the forming candle's close in the rolling window."""
+        value = close - state['shift']
+        old = state['window'][-1]
+        state['window'][-1] = value
+        state['sum'] += value - old
+        state['sum_sq'] += value * value - old * old
+    
+    @staticmethod
+    def _push_close(state: dict, close: float):
+        """Append a new candle's close, dropping the oldest one."""
+        value = close - state['shift']
+        window = state['window']
+        old = window[0]
+        window.append(value)
+        state['sum'] += value - old
+        state['sum_sq'] += value * value - old * old
+    
+    @staticmethod
+    def _bb_state_bands(state: dict, current_price: float) -> tuple:
+        """Mean and sample std of the rolling window from its running sums."""
+        n = state['period']
+        mean = state['sum'] / n
+        if n > 1:
+            var = max(state['sum_sq'] / n - mean * mean, 0.0)
+            std = math.sqrt(var * n / (n - 1))
+        else:
+            std = np.nan
+        return current_price, mean + state['shift'], std
+    
+    def _signal_from_window(self, coin: str, window: Optional[tuple]) -> Optional[Signal]:
+        """
+        Build the Bollinger Bands signal from _update_bb_state's band inputs.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            window: Tuple of (current_price, middle_band, std), or None
             
-            logger.info(f"{self.name}: {signal}")
-            return signal
+        Returns:
+            Signal object or None if unable to generate
+        """
+        if window is None:
+            logger.warning(f"{self.name}: Insufficient data for {coin}")
+            return None
+        
+        return self._signal_from_bands(coin, *window)
+    
+    def _signal_from_bands(self, coin: str, current_price: float, current_middle: float,
+                           std: float) -> Optional[Signal]:
+        """
+        Build the Bollinger Bands signal from the latest price, middle band and std.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC", "ETH")
+            current_price: Latest close
+            current_middle: Middle band (SMA) of the latest window
+            std: Sample standard deviation of the latest window
             
-        except Exception as e:
-            logger.error(f"{self.name}: Error generating signal for {coin}: {e}")
+        Returns:
+            Signal object or None if unable to generate
+        """
+        current_upper = current_middle + (std * self.std_dev)
+        current_lower = current_middle - (std * self.std_dev)
+        current_bandwidth = ((current_upper - current_lower) / current_middle) * 100
+        
+        # Check for NaN (or infinite) values - both propagate through the sum
+        if not math.isfinite(current_middle + current_upper + current_lower):
+            logger.warning(f"{self.name}: Invalid BB values for {coin}")
             return None
+        
+        # Calculate BB position
+        bb_position = self._calculate_bb_position(
+            current_price, current_upper, current_lower, current_middle
+        )
+        
+        # Determine action based on band proximity
+        action = "HOLD"
+        distance_to_lower = abs(current_price - current_lower) / current_lower * 100
+        distance_to_upper = abs(current_upper - current_price) / current_upper * 100
+        
+        # BUY signal: Price near or below lower band
+        if bb_position <= 0.2 or distance_to_lower <= self.touch_threshold:
+            action = "BUY"
+        
+        # SELL signal: Price near or above upper band
+        elif bb_position >= 0.8 or distance_to_upper <= self.touch_threshold:
+            action = "SELL"
+        
+        # Calculate signal strength
+        strength = self._calculate_signal_strength(
+            bb_position, current_bandwidth, action,
+            distance_to_lower if action == "BUY" else distance_to_upper
+        )
+        
+        # Round the price fields in one numpy call
+        price, upper, middle, lower = np.array(
+            [current_price, current_upper, current_middle, current_lower]
+        ).round(6).tolist()
+        
+        # Create signal
+        signal = Signal(
+            coin=coin,
+            action=action,
+            strength=strength,
+            timestamp=datetime.now(),
+            source=self.name,
+            metadata={
+                'current_price': price,
+                'upper_band': upper,
+                'middle_band': middle,
+                'lower_band': lower,
+                'bb_position': round(bb_position, 3),
+                'bandwidth': round(current_bandwidth, 2),
+                'period': self.period,
+                'std_dev': self.std_dev,
+                'timeframe': '30m'
+            }
+        )
+        
+        logger.info(f"{self.name}: {signal}")
+        return signal
@@ -5,17 +5,71 @@ Generates BUY signals near support and SELL signals near resistance.
 """
 
 import time
-import requests
-import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from core.signal import Signal
 from utils.logger import get_logger
+from utils.binance_http import SESSION, KLINES_URL, parse_klines
 from utils.backtest_results_loader import get_backtest_loader
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Recently fetched candles: (coin, interval, limit) -> (fetch time, OHLCV arrays)
+_CANDLE_CACHE = {}
+CANDLE_CACHE_TTL = 300  # Seconds a fetched 1-hour candle set is reused
+
+
+def _pivot_masks(highs: np.ndarray, lows: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flag strict pivot highs/lows with plain loops (compiled with Numba when available).
+    
+    Args:
+        highs: Array of candle highs
+        lows: Array of candle lows
+        window: Bars on each side a pivot must exceed
+        
+    Returns:
+        Tuple of boolean arrays (is_resistance, is_support), one entry per bar
+    """
+    n = highs.shape[0]
+    is_resistance = np.zeros(n, dtype=np.bool_)
+    is_support = np.zeros(n, dtype=np.bool_)
+    
+    for i in range(window, n - window):
+        resistance = True
+        support = True
+        for j in range(i - window, i + window + 1):
+            if j == i:
+                continue
+            if highs[j] >= highs[i]:
+                resistance = False
+            if lows[j] <= lows[i]:
+                support = False
+            if not resistance and not support:
+                break
+        is_resistance[i] = resistance
+        is_support[i] = support
+    
+    return is_resistance, is_support
+
+
+if NUMBA_AVAILABLE:
+    _pivot_masks = njit(cache=True)(_pivot_masks)
+
 
 class SupportResistance1HSignalGenerator:
     """
@@ -53,6 +107,9 @@ class SupportResistance1HSignalGenerator:
         # Get backtest loader
         self.backtest_loader = get_backtest_loader()
         
+        # Last computed levels per coin: coin -> (cache key, resistance_levels, support_levels)
+        self._sr_cache = {}
+        
         logger.info(f"Initialized {self.name} (default: lookback={lookback_periods}, min_touches={min_touches}, tolerance={tolerance_percent}%)")
     
     def _rate_limit(self):
@@ -62,7 +119,7 @@ class SupportResistance1HSignalGenerator:
             time.sleep(self.min_request_interval - elapsed)
         self.last_request_time = time.time()
     
-    def _fetch_candles(self, coin: str, limit: int = 200) -> Optional[pd.DataFrame]:
+    def _fetch_candles(self, coin: str, limit: int = 200) -> Optional[Dict[str, np.ndarray]]:
         """
         Fetch 1-hour candles from Binance free API.
         
@@ -71,85 +128,72 @@ class SupportResistance1HSignalGenerator:
             limit: Number of candles to fetch
             
         Returns:
-            DataFrame with OHLCV data or None if failed
+            Dict of OHLCV arrays (timestamps in epoch ms) or None if failed
         """
+        key = (coin, '1h', limit)
+        cached = _CANDLE_CACHE.get(key)
+        if cached is not None and time.time() - cached[0] < CANDLE_CACHE_TTL:
+            return cached[1]
+        
         try:
             self._rate_limit()
             
             symbol = f"{coin}USDT"
-            url = "https://api.binance.com/api/v3/klines"
             params = {
                 'symbol': symbol,
                 'interval': '1h',
                 'limit': limit
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = SESSION.get(KLINES_URL, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            # Convert to numeric
-            df['open'] = pd.to_numeric(df['open'])
-            df['high'] = pd.to_numeric(df['high'])
-            df['low'] = pd.to_numeric(df['low'])
-            df['close'] = pd.to_numeric(df['close'])
-            df['volume'] = pd.to_numeric(df['volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
-            return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            candles = parse_klines(data)
+            _CANDLE_CACHE[key] = (time.time(), candles)
+            return candles
             
         except Exception as e:
             logger.error(f"Failed to fetch candles for {coin}: {e}")
             return None
     
-    def _find_pivot_points(self, df: pd.DataFrame, window: int = 5) -> Tuple[List[float], List[float]]:
+    def _find_pivot_points(self, candles: Dict[str, np.ndarray], window: int = 5) -> Tuple[List[float], List[float]]:
         """
         Find pivot points (highs and lows) in the price data.
         
+        A bar is a pivot high (low) when its high (low) is strictly above (below)
+        every other bar within `window` bars on either side.
+        
         Args:
-            df: DataFrame with OHLC data
+            candles: Dict of OHLC arrays
             window: Window size for pivot detection
             
         Returns:
             Tuple of (resistance_levels, support_levels)
         """
-        highs = []
-        lows = []
+        highs_arr = candles['high']
+        lows_arr = candles['low']
         
-        for i in range(window, len(df) - window):
-            # Check for resistance (local high)
-            current_high = df['high'].iloc[i]
-            is_resistance = True
-            
-            for j in range(i - window, i + window + 1):
-                if j != i and df['high'].iloc[j] >= current_high:
-                    is_resistance = False
-                    break
-            
-            if is_resistance:
-                highs.append(current_high)
-            
-            # Check for support (local low)
-            current_low = df['low'].iloc[i]
-            is_support = True
-            
-            for j in range(i - window, i + window + 1):
-                if j != i and df['low'].iloc[j] <= current_low:
-                    is_support = False
-                    break
-            
-            if is_support:
-                lows.append(current_low)
+        size = 2 * window + 1
+        if highs_arr.shape[0] < size:
+            return [], []
+        
+        if NUMBA_AVAILABLE:
+            is_resistance, is_support = _pivot_masks(highs_arr, lows_arr, window)
+            return highs_arr[is_resistance].tolist(), lows_arr[is_support].tolist()
+        
+        # One row per candidate bar, holding the bars around it
+        high_windows = sliding_window_view(highs_arr, size)
+        low_windows = sliding_window_view(lows_arr, size)
+        center_highs = highs_arr[window:len(highs_arr) - window]
+        center_lows = lows_arr[window:len(lows_arr) - window]
         
-        return highs, lows
+        # Strict extremes: the centre bar is the only one reaching the window max/min
+        is_resistance = (high_windows >= center_highs[:, None]).sum(axis=1) == 1
+        is_support = (low_windows <= center_lows[:, None]).sum(axis=1) == 1
+        
+        return center_highs[is_resistance].tolist(), center_lows[is_support].tolist()
     
     def _cluster_levels(self, levels: List[float], tolerance_percent: float) -> List[float]:
         """
@@ -165,32 +209,42 @@ class SupportResistance1HSignalGenerator:
         if not levels:
             return []
         
-        # Sort levels
-        sorted_levels = sorted(levels)
-        clustered = []
+        # Label clusters in one pass over the sorted levels, tracking each
+        # cluster's running sum instead of re-averaging it for every level
+        sorted_levels = np.sort(np.asarray(levels, dtype=np.float64))
+        labels = np.zeros(len(sorted_levels), dtype=np.intp)
+        label = 0
+        total = float(sorted_levels[0])
+        count = 1
         
-        for level in sorted_levels:
-            if not clustered:
-                clustered.append([level])
+        for i, level in enumerate(sorted_levels[1:].tolist(), start=1):
+            # Check if level is close to the last cluster
+            last_cluster_avg = total / count
+            tolerance = last_cluster_avg * (tolerance_percent / 100)
+            
+            if abs(level - last_cluster_avg) <= tolerance:
+                total += level
+                count += 1
             else:
-                # Check if level is close to the last cluster
-                last_cluster_avg = np.mean(clustered[-1])
-                tolerance = last_cluster_avg * (tolerance_percent / 100)
-                
-                if abs(level - last_cluster_avg) <= tolerance:
-                    clustered[-1].append(level)
-                else:
-                    clustered.append([level])
+                label += 1
+                total = level
+                count = 1
+            labels[i] = label
         
         # Return average of each cluster
-        return [np.mean(cluster) for cluster in clustered if len(cluster) >= self.min_touches]
+        counts = np.bincount(labels)
+        means = np.bincount(labels, weights=sorted_levels) / counts
+        return means[counts >= self.min_touches].tolist()
     
     def _filter_levels_by_distance(self, levels: List[float], min_distance_percent: float) -> List[float]:
         """
         Filter levels to ensure minimum distance between them.
         
+        Levels come sorted ascending from _cluster_levels, so the last kept level
+        is always the closest kept one and is the only one that needs checking.
+        
         Args:
-            levels: List of price levels
+            levels: List of price levels, sorted ascending
             min_distance_percent: Minimum distance as percentage
             
         Returns:
@@ -202,31 +256,24 @@ class SupportResistance1HSignalGenerator:
         filtered = [levels[0]]
         
         for level in levels[1:]:
-            is_valid = True
-            
-            for filtered_level in filtered:
-                distance = abs(level - filtered_level) / filtered_level * 100
-                if distance < min_distance_percent:
-                    is_valid = False
-                    break
-            
-            if is_valid:
+            distance = abs(level - filtered[-1]) / filtered[-1] * 100
+            if distance >= min_distance_percent:
                 filtered.append(level)
         
         return filtered
     
-    def _identify_support_resistance_levels(self, df: pd.DataFrame) -> Tuple[List[float], List[float]]:
+    def _identify_support_resistance_levels(self, candles: Dict[str, np.ndarray]) -> Tuple[List[float], List[float]]:
         """
         Identify key support and resistance levels.
         
         Args:
-            df: DataFrame with OHLC data
+            candles: Dict of OHLC arrays
             
         Returns:
             Tuple of (resistance_levels, support_levels)
         """
         # Find pivot points
-        highs, lows = self._find_pivot_points(df)
+        highs, lows = self._find_pivot_points(candles)
         
         # Cluster similar levels
         resistance_levels = self._cluster_levels(highs, self.tolerance_percent)
@@ -337,16 +384,25 @@ class SupportResistance1HSignalGenerator:
             self._load_coin_parameters(coin)
             
             # Fetch candles (need more data for S/R analysis)
-            df = self._fetch_candles(coin, limit=self.lookback_periods + 50)
-            if df is None or len(df) < self.lookback_periods:
+            candles = self._fetch_candles(coin, limit=self.lookback_periods + 50)
+            n = 0 if candles is None else len(candles['close'])
+            if n < self.lookback_periods:
                 logger.warning(f"{self.name}: Insufficient data for {coin}")
                 return None
             
             # Get current price
-            current_price = df['close'].iloc[-1]
-            
-            # Identify support and resistance levels
-            resistance_levels, support_levels = self._identify_support_resistance_levels(df)
+            current_price = candles['close'][-1]
+            
+            # Identify support and resistance levels, reusing the last result while
+            # the candles (including the still-open one) and parameters are unchanged
+            cache_key = (candles['timestamp'][-1], candles['high'][-1], candles['low'][-1], n,
+                         self.min_touches, self.tolerance_percent, self.min_distance_percent)
+            cached = self._sr_cache.get(coin)
+            if cached is not None and cached[0] == cache_key:
+                resistance_levels, support_levels = cached[1], cached[2]
+            else:
+                resistance_levels, support_levels = self._identify_support_resistance_levels(candles)
+                self._sr_cache[coin] = (cache_key, resistance_levels, support_levels)
             
             if not resistance_levels and not support_levels:
                 logger.warning(f"{self.name}: No S/R levels found for {coin}")
@@ -376,6 +432,11 @@ class SupportResistance1HSignalGenerator:
                 current_price, nearest_resistance, nearest_support, action
             )
             
+            # Round the price fields in one numpy call
+            price, resistance, support = np.array(
+                [current_price, nearest_resistance or np.nan, nearest_support or np.nan]
+            ).round(6).tolist()
+            
             # Create signal
             signal = Signal(
                 coin=coin,
@@ -384,9 +445,9 @@ class SupportResistance1HSignalGenerator:
                 timestamp=datetime.now(),
                 source=self.name,
                 metadata={
-                    'current_price': round(current_price, 6),
-                    'nearest_resistance': round(nearest_resistance, 6) if nearest_resistance else None,
-                    'nearest_support': round(nearest_support, 6) if nearest_support else None,
+                    'current_price': price,
+                    'nearest_resistance': resistance if nearest_resistance else None,
+                    'nearest_support': support if nearest_support else None,
                     'resistance_levels_count': len(resistance_levels),
                     'support_levels_count': len(support_levels),
                     'lookback_periods': self.lookback_periods,
@@ -0,0 +1,117 @@
+"""
+Tests for the vectorized trade simulator against the original position loop
+"""
+
+import unittest
+
+import numpy as np
+
+from panel_modules.backtest_simulator import (
+    ACTION_BUY, ACTION_SELL, SIGNAL_DTYPE, TRADE_DTYPE, _pair_signals, simulate_trades
+)
+
+POSITION_SIZE = 100.0
+
+
+def _signals(actions: list, prices: list = None) -> np.ndarray:
+    """Build a SIGNAL_DTYPE array from 'BUY'/'SELL' strings, one minute apart"""
+    n = len(actions)
+    signals = np.zeros(n, dtype=SIGNAL_DTYPE)
+    signals['timestamp'] = np.datetime64('2024-01-01') + np.arange(n) * np.timedelta64(1, 'm')
+    signals['price'] = prices if prices is not None else 100.0 + np.arange(n)
+    signals['rsi'] = np.nan
+    signals['action'] = [ACTION_BUY if action == 'BUY' else ACTION_SELL for action in actions]
+    return signals
+
+
+def _reference_trades(signals: np.ndarray, position_size: float) -> list:
+    """The list-of-dicts position loop that simulate_trades replaced"""
+    trades = []
+    position = None
+    
+    for signal in signals:
+        if signal['action'] == ACTION_BUY and position is None:
+            position = {'entry_time': signal['timestamp'], 'entry_price': signal['price']}
+            
+        elif signal['action'] == ACTION_SELL and position is not None:
+            pnl_pct = ((signal['price'] - position['entry_price']) / position['entry_price']) * 100
+            trades.append({
+                'entry_time': position['entry_time'],
+                'entry_price': position['entry_price'],
+                'exit_time': signal['timestamp'],
+                'exit_price': signal['price'],
+                'pnl_pct': pnl_pct,
+                'profit_usd': (pnl_pct / 100) * position_size
+            })
+            position = None
+    
+    return trades
+
+
+class SimulateTradesTest(unittest.TestCase):
+    
+    def assertMatchesReference(self, signals):
+        trades = simulate_trades(signals, POSITION_SIZE)
+        expected = _reference_trades(signals, POSITION_SIZE)
+        self.assertEqual(trades.dtype, TRADE_DTYPE)
+        self.assertEqual(len(trades), len(expected))
+        for trade, want in zip(trades, expected):
+            for field in TRADE_DTYPE.names:
+                self.assertEqual(trade[field], want[field], field)
+        return trades
+    
+    def test_no_signals(self):
+        entry_idx, exit_idx = _pair_signals(np.empty(0, dtype=np.int8))
+        self.assertEqual((entry_idx.size, exit_idx.size), (0, 0))
+        self.assertEqual(len(self.assertMatchesReference(_signals([]))), 0)
+    
+    def test_repeated_buys_are_ignored(self):
+        signals = _signals(['BUY', 'BUY', 'BUY', 'SELL', 'BUY', 'BUY', 'SELL'])
+        entry_idx, exit_idx = _pair_signals(signals['action'])
+        self.assertEqual(entry_idx.tolist(), [0, 4])
+        self.assertEqual(exit_idx.tolist(), [3, 6])
+        self.assertMatchesReference(signals)
+    
+    def test_repeated_sells_are_ignored(self):
+        signals = _signals(['BUY', 'SELL', 'SELL', 'BUY', 'SELL', 'SELL', 'SELL'])
+        entry_idx, exit_idx = _pair_signals(signals['action'])
+        self.assertEqual(entry_idx.tolist(), [0, 3])
+        self.assertEqual(exit_idx.tolist(), [1, 4])
+        self.assertMatchesReference(signals)
+    
+    def test_leading_sells_are_dropped(self):
+        signals = _signals(['SELL', 'SELL', 'BUY', 'SELL'])
+        entry_idx, exit_idx = _pair_signals(signals['action'])
+        self.assertEqual(entry_idx.tolist(), [2])
+        self.assertEqual(exit_idx.tolist(), [3])
+        self.assertMatchesReference(signals)
+    
+    def test_only_sells_make_no_trades(self):
+        self.assertEqual(len(self.assertMatchesReference(_signals(['SELL', 'SELL']))), 0)
+    
+    def test_open_position_at_end_is_discarded(self):
+        signals = _signals(['BUY', 'SELL', 'BUY', 'BUY'])
+        entry_idx, exit_idx = _pair_signals(signals['action'])
+        self.assertEqual(entry_idx.tolist(), [0])
+        self.assertEqual(exit_idx.tolist(), [1])
+        self.assertMatchesReference(signals)
+        self.assertEqual(len(self.assertMatchesReference(_signals(['BUY']))), 0)
+    
+    def test_profit_and_loss(self):
+        trades = self.assertMatchesReference(_signals(['BUY', 'SELL', 'BUY', 'SELL'],
+                                                      [100.0, 110.0, 50.0, 40.0]))
+        self.assertEqual(trades['pnl_pct'].tolist(), [10.0, -20.0])
+        self.assertEqual(trades['profit_usd'].tolist(), [10.0, -20.0])
+    
+    def test_random_sequences_match_reference(self):
+        rng = np.random.default_rng(0)
+        for n in range(200):
+            count = int(rng.integers(0, 40))
+            actions = rng.choice(['BUY', 'SELL'], size=count).tolist()
+            prices = np.round(rng.uniform(50.0, 150.0, count), 2)
+            with self.subTest(n=n, actions=actions):
+                self.assertMatchesReference(_signals(actions, prices))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+"""
+Tests for the backtest strategies: short inputs, and the fused kernels and
+sweeps against the indicator + simulate_trades path
+"""
+
+import io
+import itertools
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from panel_modules.backtest_strategies import (
+    _build_signals, _previous, run_bollinger_bands_backtest, run_rsi_backtest,
+    run_rsi_sweep, run_sma_backtest, run_sma_sweep
+)
+from panel_modules.backtest_indicators import (
+    calculate_ema, calculate_macd, calculate_rsi, calculate_sma, calculate_volume_spike
+)
+from panel_modules.backtest_portfolio_numba import (
+    simulate_macd_fused, simulate_macd_signal, simulate_rsi_fused,
+    simulate_scalping_fused, simulate_sma_fused
+)
+from panel_modules.backtest_simulator import simulate_trades
+
+POSITION_SIZE = 100.0
+
+
+def _candles(count: int) -> pd.DataFrame:
+    """Build a DataFrame of rising OHLCV candles"""
+    close = np.linspace(100.0, 110.0, count)
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=count, freq='h'),
+        'open': close,
+        'high': close,
+        'low': close,
+        'close': close,
+        'volume': np.ones(count),
+    })
+
+
+def _random_candles(seed: int, count: int = 600) -> pd.DataFrame:
+    """Build seeded random-walk candles on a 0.01 price tick with flat stretches"""
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 * np.cumprod(1 + rng.normal(0.0, 0.004, count)), 2)
+    # Flat opening bars leave RSI undefined past its warm-up; flat windows make SMAs tie
+    close[:30] = close[30]
+    close[200:260] = close[200]
+    close[400:403] = close[400]
+    volume = rng.lognormal(0.0, 0.5, count)
+    volume[::17] *= 4
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=count, freq='min'),
+        'open': close,
+        'high': close,
+        'low': close,
+        'close': close,
+        'volume': volume,
+    })
+
+
+def _kernel_frames() -> list:
+    """Random candle sets, plus one that never leaves the indicator warm-up"""
+    frames = [_random_candles(seed) for seed in range(4)]
+    frames.append(_random_candles(4).iloc[:12].reset_index(drop=True))
+    return frames
+
+
+def _reference_totals(df: pd.DataFrame, buy: np.ndarray, sell: np.ndarray,
+                      rsi: np.ndarray = None) -> tuple:
+    """(signals, trades, wins, total profit) of BUY/SELL masks through simulate_trades"""
+    idx = np.flatnonzero(buy | sell)
+    signals = _build_signals(idx, buy[idx], df['timestamp'].to_numpy(),
+                             df['close'].to_numpy(), rsi)
+    profits = simulate_trades(signals, POSITION_SIZE)['profit_usd'].tolist()
+    return len(signals), len(profits), sum(profit > 0 for profit in profits), sum(profits)
+
+
+class ShortInputTest(unittest.TestCase):
+    
+    def test_previous_of_empty_array(self):
+        self.assertEqual(len(_previous(np.empty(0))), 0)
+    
+    def test_sma_backtest_shorter_than_long_period(self):
+        df = _candles(10)
+        short_sma = calculate_sma(df['close'], 5).to_numpy()
+        long_sma = calculate_sma(df['close'], 20).to_numpy()
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = run_sma_backtest(df, 'BTC', 5, 20, 100,
+                                      short_precomputed=short_sma,
+                                      long_precomputed=long_sma)
+        self.assertIsNone(result)
+        self.assertEqual(output.getvalue(), '')
+    
+    def test_sma_backtest_fused_shorter_than_long_period(self):
+        self.assertIsNone(run_sma_backtest(_candles(10), 'BTC', 5, 20, 100))
+    
+    def test_bollinger_backtest_shorter_than_period(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = run_bollinger_bands_backtest(_candles(10), 'BTC', 20, 2.0, 0.5, 100)
+        self.assertIsNone(result)
+        self.assertEqual(output.getvalue(), '')
+
+
+class FusedKernelTest(unittest.TestCase):
+    
+    def setUp(self):
+        # The reference is the built-in indicator code; TA-Lib rounds flat stretches differently
+        patcher = patch('panel_modules.backtest_indicators.TALIB_AVAILABLE', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.frames = _kernel_frames()
+    
+    def test_rsi_fused(self):
+        for n, df in enumerate(self.frames):
+            close = df['close'].to_numpy()
+            for period, oversold, overbought in itertools.product([2, 7, 14], [25, 30, 40], [60, 70]):
+                rsi = calculate_rsi(df['close'], period).to_numpy()
+                buy = rsi <= oversold
+                sell = ~buy & (rsi >= overbought)
+                with self.subTest(frame=n, period=period, oversold=oversold, overbought=overbought):
+                    self.assertEqual(
+                        tuple(simulate_rsi_fused(close, period, oversold, overbought, POSITION_SIZE)),
+                        _reference_totals(df, buy, sell, rsi))
+    
+    def test_sma_fused(self):
+        for n, df in enumerate(self.frames):
+            close = df['close'].to_numpy()
+            for short_period, long_period in itertools.product([1, 3, 5, 10], [5, 20, 30]):
+                short_sma = calculate_sma(df['close'], short_period).to_numpy()
+                long_sma = calculate_sma(df['close'], long_period).to_numpy()
+                prev_short = _previous(short_sma)
+                prev_long = _previous(long_sma)
+                buy = (prev_short <= prev_long) & (short_sma > long_sma)
+                sell = ~buy & (prev_short >= prev_long) & (short_sma < long_sma)
+                with self.subTest(frame=n, short_period=short_period, long_period=long_period):
+                    self.assertEqual(
+                        tuple(simulate_sma_fused(close, short_period, long_period, POSITION_SIZE)),
+                        _reference_totals(df, buy, sell))
+    
+    def test_macd_fused_and_signal(self):
+        for n, df in enumerate(self.frames):
+            close = df['close'].to_numpy()
+            for fast, slow, signal in itertools.product([5, 12], [20, 26], [5, 9]):
+                histogram = calculate_macd(df['close'], fast, slow, signal)[2].to_numpy()
+                prev_histogram = _previous(histogram)
+                buy = (prev_histogram <= 0) & (histogram > 0)
+                sell = ~buy & (prev_histogram >= 0) & (histogram < 0)
+                expected = _reference_totals(df, buy, sell)
+                macd_line = calculate_macd(df['close'], fast, slow, 1)[0].to_numpy()
+                with self.subTest(frame=n, fast=fast, slow=slow, signal=signal):
+                    self.assertEqual(tuple(simulate_macd_fused(close, fast, slow, signal, POSITION_SIZE)),
+                                     expected)
+                    self.assertEqual(tuple(simulate_macd_signal(close, macd_line, signal, POSITION_SIZE)),
+                                     expected)
+    
+    def test_scalping_fused(self):
+        grid = itertools.product([3, 5], [10, 15], [5, 9], [25, 35], [65, 75], [1.3, 2.0])
+        for fast_ema, slow_ema, rsi_period, oversold, overbought, multiplier in grid:
+            for n, df in enumerate(self.frames):
+                fast = calculate_ema(df['close'], fast_ema).to_numpy()
+                slow = calculate_ema(df['close'], slow_ema).to_numpy()
+                rsi = calculate_rsi(df['close'], rsi_period).to_numpy()
+                spike = calculate_volume_spike(df['volume'], multiplier).to_numpy()
+                prev_fast = _previous(fast)
+                prev_slow = _previous(slow)
+                valid = ~np.isnan(fast) & ~np.isnan(rsi) & spike & (rsi > oversold) & (rsi < overbought)
+                buy = valid & (prev_fast <= prev_slow) & (fast > slow)
+                sell = valid & ~buy & (prev_fast >= prev_slow) & (fast < slow)
+                fused = simulate_scalping_fused(
+                    df['close'].to_numpy(), df['volume'].to_numpy(), fast_ema, slow_ema,
+                    rsi_period, oversold, overbought, multiplier, POSITION_SIZE)
+                with self.subTest(frame=n, fast_ema=fast_ema, slow_ema=slow_ema, rsi_period=rsi_period,
+                                  oversold=oversold, overbought=overbought, multiplier=multiplier):
+                    self.assertEqual(tuple(fused), _reference_totals(df, buy, sell, rsi))
+
+
+class SweepTest(unittest.TestCase):
+    
+    def assertSameResults(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for got, want in zip(actual, expected):
+            self.assertEqual({k: v for k, v in got.items() if not isinstance(v, float)},
+                             {k: v for k, v in want.items() if not isinstance(v, float)})
+            for key in ('win_rate', 'total_profit_usd', 'avg_profit'):
+                self.assertAlmostEqual(got[key], want[key], places=9)
+    
+    def test_rsi_sweep_matches_backtest(self):
+        periods, oversold_levels, overbought_levels = [2, 7, 14], [25, 30, 40], [60, 70]
+        for n, df in enumerate(_kernel_frames()):
+            expected = [run_rsi_backtest(df, 'BTC', period, oversold, overbought, POSITION_SIZE)
+                        for period, oversold, overbought
+                        in itertools.product(periods, oversold_levels, overbought_levels)]
+            with self.subTest(frame=n):
+                self.assertEqual(run_rsi_sweep(df, 'BTC', periods, oversold_levels, overbought_levels,
+                                               POSITION_SIZE),
+                                 [result for result in expected if result])
+
+    def test_sma_sweep_matches_backtest(self):
+        short_periods, long_periods = [1, 3, 5, 10], [5, 20, 30]
+        for n, df in enumerate(_kernel_frames()):
+            expected = [run_sma_backtest(df, 'BTC', short_period, long_period, POSITION_SIZE)
+                        for short_period, long_period in itertools.product(short_periods, long_periods)]
+            with self.subTest(frame=n):
+                self.assertSameResults(run_sma_sweep(df, 'BTC', short_periods, long_periods, POSITION_SIZE),
+                                       [result for result in expected if result])
+
+
+if __name__ == '__main__':
+    unittest.main()